@@ -1,11 +1,13 @@
-import json
-import sqlite3
 from collections import defaultdict
+import sys
 from pathlib import Path
 
-BASE = Path(__file__).parent.resolve()
-conn = sqlite3.connect(BASE / "results.db")
-cur = conn.cursor()
+# Shared modules live in the service directory, one level up
+SERVICE_DIR = str(Path(__file__).resolve().parent.parent)
+if SERVICE_DIR not in sys.path:
+    sys.path.insert(0, SERVICE_DIR)
+
+from io_fast import dump_json
 
 # Define search results from all searches run
 search_data = {
@@ -143,6 +145,9 @@ for category, items in search_data.items():
             if category not in all_convos[convo_id]['categories']:
                 all_convos[convo_id]['categories'].append(category)
 
+# Convo ids per category, so cluster sizes are set unions rather than tuple scans
+ids_by_cat = {cat: {t[0] for t in items} for cat, items in search_data.items()}
+
 # Print summary stats
 print('=' * 70)
 print('DEEP SEARCH RESULTS: BUSINESS, MONEY, WORK & WEALTH')
@@ -161,9 +166,16 @@ for cat in search_data.keys():
     print(f'  {cat:<30} {count:>3}')
 print()
 
+# Bucket by best score in one pass: strong >=50, medium 30-50, weak <30
+buckets = {'strong': [], 'medium': [], 'weak': []}
+for k, v in all_convos.items():
+    s = v['best_score']
+    buckets['strong' if s >= 50 else 'medium' if s >= 30 else 'weak'].append((k, v))
+for b in buckets.values():
+    b.sort(key=lambda x: -x[1]['best_score'])
+strong, medium, weak = buckets['strong'], buckets['medium'], buckets['weak']
+
 # Strong matches (>50%)
-strong = [(k, v) for k, v in all_convos.items() if v['best_score'] >= 50]
-strong.sort(key=lambda x: -x[1]['best_score'])
 print(f'STRONG MATCHES (>50%): {len(strong)}')
 print('-' * 70)
 for cid, data in strong:
@@ -172,8 +184,6 @@ for cid, data in strong:
 print()
 
 # Medium matches (30-50%)
-medium = [(k, v) for k, v in all_convos.items() if 30 <= v['best_score'] < 50]
-medium.sort(key=lambda x: -x[1]['best_score'])
 print(f'MEDIUM MATCHES (30-50%): {len(medium)}')
 print('-' * 70)
 for cid, data in medium:
@@ -182,8 +192,6 @@ for cid, data in medium:
 print()
 
 # Weak but relevant (<30%)
-weak = [(k, v) for k, v in all_convos.items() if v['best_score'] < 30]
-weak.sort(key=lambda x: -x[1]['best_score'])
 print(f'WEAK BUT RELEVANT (<30%): {len(weak)}')
 print('-' * 70)
 for cid, data in weak:
@@ -216,10 +224,7 @@ clusters = {
 }
 
 for cluster_name, categories in clusters.items():
-    cluster_convos = set()
-    for cat in categories:
-        for convo_id, title, date, score in search_data.get(cat, []):
-            cluster_convos.add(convo_id)
+    cluster_convos = set().union(*(ids_by_cat.get(cat, ()) for cat in categories))
     print(f"\n{cluster_name}")
     print(f"  Categories: {', '.join(categories)}")
     print(f"  Unique conversations: {len(cluster_convos)}")
@@ -256,11 +261,8 @@ for cluster_name, categories in clusters.items():
     cluster_convos.sort(key=lambda x: -x['score'])
     output['clusters'][cluster_name] = cluster_convos
 
-with open('business_wealth_clusters.json', 'w') as f:
-    json.dump(output, f, indent=2)
+dump_json('business_wealth_clusters.json', output)
 
 print("\n" + "=" * 70)
 print("Results saved to business_wealth_clusters.json")
 print("=" * 70)
-
-conn.close()
@@ -1,5 +1,16 @@
-import sqlite3, numpy as np, json
+import numpy as np
 from collections import Counter
+import sys
+from pathlib import Path
+
+# Shared modules live in the service directory, one level up
+SERVICE_DIR = str(Path(__file__).resolve().parent.parent)
+if SERVICE_DIR not in sys.path:
+    sys.path.insert(0, SERVICE_DIR)
+
+from db import connect
+from io_fast import dump_json
+import embedding_store
 
 print("Loading dependencies...")
 try:
@@ -14,7 +25,7 @@ except ImportError:
 NUM_CLUSTERS = 10  # Number of topic clusters to discover
 MIN_CLUSTER_SIZE = 3  # Ignore clusters with fewer conversations
 
-con = sqlite3.connect("results.db")
+con = connect("results.db")
 cur = con.cursor()
 
 # Check if embeddings exist
@@ -45,7 +56,7 @@ for cid, emb_blob, title, date in rows:
     convo_ids.append(cid)
     titles.append(title if title else "(untitled)")
     dates.append(date if date else "unknown")
-    embeddings_matrix.append(np.frombuffer(emb_blob, dtype=np.float32))
+    embeddings_matrix.append(embedding_store.decode(emb_blob))
 
 embeddings_matrix = np.array(embeddings_matrix)
 
@@ -79,8 +90,8 @@ for cluster_id in sorted(clusters.keys()):
     print(f"CLUSTER {cluster_id + 1} ({len(convos)} conversations)")
     print("-" * 70)
 
-    # Get all topics for conversations in this cluster
-    all_topics = []
+    # Sum topic weights across conversations in this cluster
+    topic_counts = Counter()
     for convo in convos:
         cid = convo["convo_id"]
         topic_rows = cur.execute(
@@ -88,10 +99,9 @@ for cluster_id in sorted(clusters.keys()):
             (cid,)
         ).fetchall()
         for topic, weight in topic_rows:
-            all_topics.extend([topic] * weight)  # Repeat by weight
+            topic_counts[topic] += weight
 
     # Find most common topics
-    topic_counts = Counter(all_topics)
     top_keywords = [t for t, _ in topic_counts.most_common(5)]
 
     print(f"Keywords: {', '.join(top_keywords)}")
@@ -112,8 +122,7 @@ for cluster_id in sorted(clusters.keys()):
     })
 
 # Export to JSON
-with open("topic_clusters.json", "w", encoding="utf-8") as f:
-    json.dump(cluster_summaries, f, indent=2)
+dump_json("topic_clusters.json", cluster_summaries)
 
 # Summary statistics
 print("\n=== CLUSTER STATISTICS ===")
@@ -1,36 +1,83 @@
-import json, re
+import heapq, json, string
+import numpy as np
 from collections import Counter
+from itertools import compress
+from operator import itemgetter
 from pathlib import Path
+import sys
+
+# Shared modules live in the service directory, one level up
+SERVICE_DIR = str(Path(__file__).resolve().parent.parent)
+if SERVICE_DIR not in sys.path:
+    sys.path.insert(0, SERVICE_DIR)
+
+from memory_loader import iter_memory
 
 DB = Path("memory_db.json")
-data = json.load(open(DB, encoding="utf-8"))
+
+_KEEP = frozenset(string.ascii_lowercase + string.digits)
+
+class _StripTable(dict):
+    """str.translate table: keep [a-z0-9] and whitespace, delete everything else.
+
+    Same character set as re's [^a-z0-9\s] (Unicode \s == str.isspace),
+    filled lazily per code point.
+    """
+    def __missing__(self, cp):
+        c = chr(cp)
+        self[cp] = cp if c in _KEEP or c.isspace() else None
+        return self[cp]
+
+_TBL = _StripTable()
 
 def normalize(t):
     if isinstance(t, dict):
         t = json.dumps(t)
     if not isinstance(t, str):
         t = str(t)
-    t = t.lower()
-    t = re.sub(r"[^a-z0-9\s]", "", t)
-    t = re.sub(r"\s+", " ", t).strip()
-    return t
+    # split() collapses and trims whitespace like re.sub(r"\s+", " ", t).strip()
+    return " ".join(t.lower().translate(_TBL).split())
 
-ngrams = Counter()
+MIN_COUNT = 10     # phrases below this are never reported
+TABLE_BITS = 24    # 16M-slot hash table, 64MB of uint32 counters
+MASK = (1 << TABLE_BITS) - 1
+
+def user_word_lists():
+    # Streamed per pass so the whole export is never held in memory
+    for c in iter_memory(DB):
+        for m in c["messages"]:
+            if m["role"] == "user":
+                words = normalize(m["text"]).split()
+                if len(words) >= 3:
+                    yield words
+
+def phrases(words):
+    for n in range(3, 7):   # 3–6 word phrases
+        # zip of n shifted views yields each window as a tuple, no slice copies
+        yield from map(" ".join, zip(*(words[i:] for i in range(n))))
 
-for c in data:
-    for m in c["messages"]:
-        if m["role"] == "user":
-            text = normalize(m["text"])
-            words = text.split()
-            for n in range(3, 7):   # 3–6 word phrases
-                for i in range(len(words) - n + 1):
-                    phrase = " ".join(words[i:i+n])
-                    ngrams[phrase] += 1
+def bucket_ids(ps):
+    return np.fromiter((hash(p) & MASK for p in ps), dtype=np.int64, count=len(ps))
+
+# Pass 1: count phrases by hash bucket in a flat array instead of a dict of
+# millions of string keys. Collisions only ever over-count a bucket.
+buckets = np.zeros(1 << TABLE_BITS, dtype=np.uint32)
+for words in user_word_lists():
+    np.add.at(buckets, bucket_ids(list(phrases(words))), 1)
+
+# Pass 2: exact string counts, but only for phrases whose bucket reached
+# MIN_COUNT. A phrase seen MIN_COUNT+ times always lands in such a bucket,
+# so the report is identical to counting everything.
+ngrams = Counter()
+for words in user_word_lists():
+    ps = list(phrases(words))
+    ngrams.update(compress(ps, buckets[bucket_ids(ps)] >= MIN_COUNT))
 
 with open("LANGUAGE_LOOPS.md", "w", encoding="utf-8") as f:
     f.write("# YOUR MOST REPEATED PHRASES\n\n")
-    for phrase, count in ngrams.most_common(300):
-        if count >= 10:
-            f.write(f"{count}x — {phrase}\n")
+    # Only phrases seen MIN_COUNT+ times are written, so rank just those
+    frequent = ((p, n) for p, n in ngrams.items() if n >= MIN_COUNT)
+    for phrase, count in heapq.nlargest(300, frequent, key=itemgetter(1)):
+        f.write(f"{count}x — {phrase}\n")
 
 print("LANGUAGE_LOOPS.md generated.")
@@ -1,13 +1,19 @@
 import json, re
 from collections import Counter
 from pathlib import Path
+import sys
+
+# Shared modules live in the service directory, one level up
+SERVICE_DIR = str(Path(__file__).resolve().parent.parent)
+if SERVICE_DIR not in sys.path:
+    sys.path.insert(0, SERVICE_DIR)
+
+from memory_loader import iter_memory
 
 DB = Path("memory_db.json")
 
 print("Loading memory_db.json...")
 
-data = json.load(open(DB, encoding="utf-8"))
-
 def normalize_text(t):
     if isinstance(t, str):
         return t
@@ -15,13 +21,23 @@ def normalize_text(t):
         return json.dumps(t)
     return str(t)
 
-total_convos = len(data)
+# One scan per message for both word lists; the named group says which list matched
+WORDS = re.compile(
+    r"\b(?:(?P<v>want|need|should|plan|think|feel|learn|realize|build|create|make|fix)"
+    r"|(?P<t>ai|money|school|business|relationship|project|idea|code|life|health))\b"
+)
+
+total_convos = 0
 message_counts = []
 user_word_counts = []
 assistant_word_counts = []
-all_user_text = []
+verbs = Counter()
+topics = Counter()
 
-for c in data:
+# Conversations are streamed, so user text is scanned as it goes by
+# rather than collected for a second pass
+for c in iter_memory(DB):
+    total_convos += 1
     msgs = c["messages"]
     message_counts.append(len(msgs))
 
@@ -31,7 +47,8 @@ for c in data:
 
         if m["role"] == "user":
             user_word_counts.append(words)
-            all_user_text.append(text)
+            for w in WORDS.finditer(text.lower()):
+                (verbs if w.lastgroup == "v" else topics)[w.group()] += 1
         else:
             assistant_word_counts.append(words)
 
@@ -42,9 +59,6 @@ shortest = min(message_counts)
 avg_user_words = round(sum(user_word_counts)/len(user_word_counts),2)
 avg_assistant_words = round(sum(assistant_word_counts)/len(assistant_word_counts),2)
 
-verbs = Counter(re.findall(r"\b(want|need|should|plan|think|feel|learn|realize|build|create|make|fix)\b"," ".join(all_user_text).lower()))
-topics = Counter(re.findall(r"\b(ai|money|school|business|relationship|project|idea|code|life|health)\b"," ".join(all_user_text).lower()))
-
 report = f"""
 # MY COGNITIVE PROFILE
 
@@ -1,5 +1,20 @@
 import sys, sqlite3, numpy as np
-from model_cache import get_model
+from pathlib import Path
+
+# Shared modules live in the service directory, one level up
+SERVICE_DIR = str(Path(__file__).resolve().parent.parent)
+if SERVICE_DIR not in sys.path:
+    sys.path.insert(0, SERVICE_DIR)
+
+from model_cache import get_model, encode
+import embedding_store
+from io_fast import dump_json
+
+try:
+    import faiss
+    HAS_FAISS = True
+except ImportError:
+    HAS_FAISS = False
 
 if len(sys.argv) < 2:
     print("\nUsage: python search_loops.py <query>")
@@ -32,7 +47,7 @@ model = get_model()
 
 # Encode query
 print("Encoding query...")
-query_vec = model.encode(query, show_progress_bar=False)
+query_vec = encode(query)  # L2-normalized float32
 
 # Load all conversation embeddings
 con = sqlite3.connect("results.db")
@@ -47,7 +62,7 @@ if count == 0:
 print(f"Searching {count} conversations...\n")
 
 rows = cur.execute("""
-    SELECT e.convo_id, e.embedding, ct.title, c.date
+    SELECT e.convo_id, ct.title, c.date
     FROM embeddings e
     LEFT JOIN convo_titles ct ON e.convo_id = ct.convo_id
     LEFT JOIN convo_time c ON e.convo_id = c.convo_id
@@ -57,27 +72,40 @@ rows = cur.execute("""
 convo_ids = []
 titles = []
 dates = []
-emb_list = []
 
-for cid, emb_blob, title, date in rows:
+for cid, title, date in rows:
     convo_ids.append(cid)
     titles.append(title if title else "(untitled)")
     dates.append(date if date else "unknown")
-    emb_list.append(np.frombuffer(emb_blob, dtype=np.float32))
-
-# Batch cosine similarity calculation
-from numpy.linalg import norm
-
-embeddings_matrix = np.array(emb_list)
-norms = np.linalg.norm(embeddings_matrix, axis=1)
-query_norm = np.linalg.norm(query_vec)
-similarity_scores = np.dot(embeddings_matrix, query_vec) / (norms * query_norm)
-
-# Combine results
-similarities = list(zip(convo_ids, titles, dates, similarity_scores.tolist()))
 
-# Sort by similarity (highest first)
-similarities.sort(key=lambda x: x[3], reverse=True)
+# Memory-mapped embeddings.npy when init_embeddings exported it, else the BLOBs
+embeddings_matrix = embedding_store.matrix_for(cur, convo_ids)
+if embeddings_matrix is None:
+    blobs = dict(cur.execute("SELECT convo_id, embedding FROM embeddings"))
+    embeddings_matrix = [embedding_store.decode(blobs[cid]) for cid in convo_ids]
+# Own float32 copy: faiss normalizes in place and the memmap is read-only
+embeddings_matrix = np.array(embeddings_matrix, dtype=np.float32)
+
+if HAS_FAISS:
+    # Exact inner-product index over L2-normalized rows == cosine similarity;
+    # faiss returns every row already ranked, so no Python sort is needed.
+    # The statistics below need all N scores, so this stays a flat index.
+    faiss.normalize_L2(embeddings_matrix)
+    index = faiss.IndexFlatIP(embeddings_matrix.shape[1])
+    index.add(embeddings_matrix)
+    scores, order = index.search(query_vec.reshape(1, -1), index.ntotal)
+    similarities = [(convo_ids[i], titles[i], dates[i], s)
+                    for i, s in zip(order[0].tolist(), scores[0].tolist())]
+else:
+    # Batch cosine similarity calculation
+    norms = np.linalg.norm(embeddings_matrix, axis=1)
+    similarity_scores = np.dot(embeddings_matrix, query_vec) / norms
+
+    # Combine results
+    similarities = list(zip(convo_ids, titles, dates, similarity_scores.tolist()))
+
+    # Sort by similarity (highest first)
+    similarities.sort(key=lambda x: x[3], reverse=True)
 
 # Display top 15 results
 print("=== SEARCH RESULTS ===\n")
@@ -106,7 +134,6 @@ print(f"Medium matches (30-50%): {medium_matches}")
 print(f"Weak matches (<30%): {len(similarities) - strong_matches - medium_matches}")
 
 # Export top results as JSON
-import json
 top_results = [
     {
         "convo_id": cid,
@@ -117,11 +144,10 @@ top_results = [
     for cid, title, date, sim in similarities[:15]
 ]
 
-with open("search_results.json", "w", encoding="utf-8") as f:
-    json.dump({
-        "query": query,
-        "results": top_results
-    }, f, indent=2)
+dump_json("search_results.json", {
+    "query": query,
+    "results": top_results
+})
 
 print(f"\nWrote search_results.json")
 
@@ -1,6 +1,16 @@
-import sqlite3, json, numpy as np
+import sqlite3, numpy as np
 from pathlib import Path
-from model_cache import get_model, get_model_name
+import sys
+
+# Shared modules live in the service directory, one level up
+SERVICE_DIR = str(Path(__file__).resolve().parent.parent)
+if SERVICE_DIR not in sys.path:
+    sys.path.insert(0, SERVICE_DIR)
+
+from model_cache import get_model, get_model_name, encode
+import embedding_store
+from io_fast import dump_json
+from db import temp_set
 
 print("Loading sentence-transformers model...")
 model = get_model()
@@ -18,53 +28,59 @@ if count == 0:
 
 print(f"Found {count} conversation embeddings\n")
 
-# Load all embeddings
+INTENT_TOPICS = set("want need should plan going gonna start try trying build create make learn begin".split())
+DONE_TOPICS = set("did done finished completed solved shipped fixed achieved".split())
+
+# Load the keyword metrics and title for each embedded conversation.
+# Aggregate each table before joining so duplicate rows can't fan out.
+# Topic sets live in temp tables so membership is an index lookup.
 print("Loading embeddings from database...")
+temp_set(con, "intent_topics", INTENT_TOPICS)
+temp_set(con, "done_topics", DONE_TOPICS)
 rows = cur.execute("""
-    SELECT convo_id, embedding FROM embeddings
+    SELECT e.convo_id, COALESCE(u.user_words, 0),
+           COALESCE(k.intent_kw, 0), COALESCE(k.done_kw, 0), ct.title
+    FROM embeddings e
+    LEFT JOIN (
+        SELECT convo_id, SUM(words) AS user_words
+        FROM messages WHERE role = 'user' GROUP BY convo_id
+    ) u ON u.convo_id = e.convo_id
+    LEFT JOIN (
+        SELECT convo_id,
+               SUM(CASE WHEN topic IN intent_topics THEN weight ELSE 0 END) AS intent_kw,
+               SUM(CASE WHEN topic IN done_topics THEN weight ELSE 0 END) AS done_kw
+        FROM topics GROUP BY convo_id
+    ) k ON k.convo_id = e.convo_id
+    LEFT JOIN (
+        SELECT convo_id, title, MIN(rowid) FROM convo_titles GROUP BY convo_id
+    ) ct ON ct.convo_id = e.convo_id
+    ORDER BY e.rowid
 """).fetchall()
 
-embeddings = {}
-for cid, emb_blob in rows:
-    embeddings[cid] = np.frombuffer(emb_blob, dtype=np.float32)
+# Memory-mapped embeddings.npy when init_embeddings exported it, else the BLOBs
+E = embedding_store.matrix_for(cur, [r[0] for r in rows])
+if E is None:
+    E = np.stack([embedding_store.decode(blob) for (blob,) in
+                  cur.execute("SELECT embedding FROM embeddings ORDER BY rowid")])
 
 # Define semantic signatures for intent and completion
 print("Generating semantic signatures...")
-intent_signature = model.encode(
+# One batch; rows come back L2-normalized
+S = encode([
     "want to build plan create start trying working on incomplete unfinished need help",
-    show_progress_bar=False
-)
-done_signature = model.encode(
     "finished completed solved shipped accomplished done resolved fixed successful",
-    show_progress_bar=False
-)
+])
+
+# Cosine similarity for every conversation against both signatures at once:
+# L2-normalize rows, then one (N,D) @ (D,2) matrix multiply
+E = E / np.linalg.norm(E, axis=1, keepdims=True)
+sims = E @ S.T
 
 # Calculate semantic similarity scores
 print("Scoring conversations...\n")
 results = []
 
-for cid, emb in embeddings.items():
-    # Cosine similarity = dot product / (norm1 * norm2)
-    from numpy.linalg import norm
-
-    intent_sim = np.dot(emb, intent_signature) / (norm(emb) * norm(intent_signature))
-    done_sim = np.dot(emb, done_signature) / (norm(emb) * norm(done_signature))
-
-    # Also get keyword-based metrics for comparison
-    trows = cur.execute("SELECT topic, weight FROM topics WHERE convo_id=?", (cid,)).fetchall()
-
-    INTENT_TOPICS = set("want need should plan going gonna start try trying build create make learn begin".split())
-    DONE_TOPICS = set("did done finished completed solved shipped fixed achieved".split())
-
-    intent_kw = sum(w for t, w in trows if t in INTENT_TOPICS)
-    done_kw = sum(w for t, w in trows if t in DONE_TOPICS)
-
-    # Get user word count
-    user_words = cur.execute(
-        "SELECT SUM(words) FROM messages WHERE convo_id=? AND role='user'",
-        (cid,)
-    ).fetchone()[0] or 0
-
+for (cid, user_words, intent_kw, done_kw, title), (intent_sim, done_sim) in zip(rows, sims):
     # Hybrid score: combine semantic + keyword signals
     # Semantic component (scaled to 0-100)
     semantic_score = (intent_sim * 100) - (done_sim * 100)
@@ -75,9 +91,7 @@ for cid, emb in embeddings.items():
     # Weighted combination (60% semantic, 40% keyword)
     final_score = (semantic_score * 0.6) + (keyword_score * 0.4)
 
-    # Get title
-    title = cur.execute("SELECT title FROM convo_titles WHERE convo_id=?", (cid,)).fetchone()
-    title = title[0] if title else "(untitled)"
+    title = title if title is not None else "(untitled)"
 
     results.append({
         "convo_id": cid,
@@ -104,8 +118,7 @@ else:
     top = quality_results[:15]
 
 # Export to JSON
-with open("semantic_loops.json", "w", encoding="utf-8") as f:
-    json.dump(top, f, indent=2)
+dump_json("semantic_loops.json", top)
 
 # Display results
 print("=== SEMANTIC OPEN LOOPS (Top 15) ===\n")
@@ -3,79 +3,154 @@ Quick test script to verify vectorization system is working.
 Runs all components and reports status.
 """
 
+import asyncio
+import contextlib
+import importlib.util
+import io
+import multiprocessing
+import os
+import runpy
 import subprocess
 import sqlite3
 import sys
+import traceback
 from pathlib import Path
 
-def print_header(text):
-    print("\n" + "=" * 70)
-    print(f"  {text}")
-    print("=" * 70 + "\n")
+# The step scripts all import these; a fork server imports them once and
+# every step starts as a fork of it instead of a cold interpreter
+PRELOAD = ["numpy", "sklearn", "sentence_transformers"]
+
+if "forkserver" in multiprocessing.get_all_start_methods():
+    _WARM = multiprocessing.get_context("forkserver")
+    _WARM.set_forkserver_preload(PRELOAD)
+else:  # Windows: no fork, plain subprocesses
+    _WARM = None
 
-def print_status(passed, message):
+def print_header(text, file=None):
+    print("\n" + "=" * 70, file=file)
+    print(f"  {text}", file=file)
+    print("=" * 70 + "\n", file=file)
+
+def print_status(passed, message, file=None):
     icon = "✓" if passed else "✗"
     status = "PASS" if passed else "FAIL"
-    print(f"{icon} [{status}] {message}")
+    print(f"{icon} [{status}] {message}", file=file)
     return passed
 
-def check_dependencies():
-    print_header("STEP 1: Checking Dependencies")
-
+def _exec_script(args, conn):
+    """Fork-server child: run script `args[0]` as __main__, stdout discarded."""
+    sys.argv = list(args)
+    sys.path.insert(0, str(Path(args[0]).resolve().parent))
     try:
-        import sentence_transformers
-        print_status(True, "sentence-transformers installed")
-    except ImportError:
-        print_status(False, "sentence-transformers NOT installed")
-        print("\n  Fix: pip install -r requirements.txt\n")
-        return False
-
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            runpy.run_path(args[0], run_name="__main__")
+    except SystemExit as e:
+        if not isinstance(e.code, (int, type(None))):
+            conn.send(str(e.code))
+        raise
+    except BaseException:
+        conn.send(traceback.format_exc())
+        sys.exit(1)
+
+async def _exited(proc):
+    """Wait for a multiprocessing child without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    done = loop.create_future()
+    loop.add_reader(proc.sentinel, lambda: done.done() or done.set_result(None))
     try:
-        import numpy
-        print_status(True, "numpy installed")
-    except ImportError:
-        print_status(False, "numpy NOT installed")
-        return False
-
+        await done
+    finally:
+        loop.remove_reader(proc.sentinel)
+    proc.join()
+
+async def run_script(args, timeout):
+    """Run `python *args`; return a CompletedProcess with stderr as text.
+
+    stdout is discarded (only exit status and output files are checked) and
+    stderr is only decoded on failure. Uses a warm fork-server child where
+    available. Raises subprocess.TimeoutExpired after `timeout` seconds.
+    """
+    if _WARM is None:
+        proc = await asyncio.create_subprocess_exec(
+            sys.executable, *args,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE
+        )
+        try:
+            _, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise subprocess.TimeoutExpired(args, timeout)
+        stderr = stderr.decode("utf-8", "replace") if proc.returncode else ""
+        return subprocess.CompletedProcess(args, proc.returncode, None, stderr)
+
+    recv, send = _WARM.Pipe(duplex=False)
+    proc = _WARM.Process(target=_exec_script, args=(args, send))
+    proc.start()
+    send.close()
     try:
-        import sklearn
-        print_status(True, "scikit-learn installed")
-    except ImportError:
-        print_status(False, "scikit-learn NOT installed")
-        return False
+        await asyncio.wait_for(_exited(proc), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        proc.join()
+        raise subprocess.TimeoutExpired(args, timeout)
+    try:
+        stderr = recv.recv()
+    except EOFError:  # child sent nothing: clean exit
+        stderr = ""
+    recv.close()
+    return subprocess.CompletedProcess(args, proc.exitcode, None, stderr)
+
+# import name -> pip name
+DEPENDENCIES = {
+    "sentence_transformers": "sentence-transformers",
+    "numpy": "numpy",
+    "sklearn": "scikit-learn",
+}
+
+def check_dependencies():
+    print_header("STEP 1: Checking Dependencies")
+
+    # find_spec only locates the package; importing sentence_transformers
+    # would pull in torch and transformers just to answer yes/no
+    for module, package in DEPENDENCIES.items():
+        if importlib.util.find_spec(module) is None:
+            print_status(False, f"{package} NOT installed")
+            print("\n  Fix: pip install -r requirements.txt\n")
+            return False
+        print_status(True, f"{package} installed")
 
     return True
 
-def check_embeddings():
+def check_embeddings(present):
     print_header("STEP 2: Checking Embeddings")
 
-    if not Path("results.db").exists():
+    if "results.db" not in present:
         print_status(False, "results.db not found")
         print("\n  Fix: Run python init_results_db.py first\n")
         return False
 
     print_status(True, "results.db exists")
 
-    con = sqlite3.connect("results.db")
-    cur = con.cursor()
-
-    # Check if embeddings table exists
-    tables = cur.execute(
-        "SELECT name FROM sqlite_master WHERE type='table' AND name='embeddings'"
-    ).fetchall()
-
-    if not tables:
+    # Read-only, autocommit: no write lock or implicit transaction for a probe.
+    # The COUNT doubles as the existence check: it fails to prepare when the
+    # table is missing, so one statement answers both questions.
+    con = sqlite3.connect("file:results.db?mode=ro", uri=True, isolation_level=None)
+    try:
+        count = con.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+    except sqlite3.OperationalError as e:
+        if "no such table" not in str(e):
+            print_status(False, f"results.db unreadable: {e}")
+            return False
         print_status(False, "embeddings table not found")
         print("\n  Fix: Run python init_embeddings.py\n")
-        con.close()
         return False
+    finally:
+        con.close()
 
     print_status(True, "embeddings table exists")
 
-    # Check row count
-    count = cur.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
-    con.close()
-
     if count == 0:
         print_status(False, f"embeddings table is empty (0 rows)")
         print("\n  Fix: Run python init_embeddings.py\n")
@@ -84,102 +159,112 @@ def check_embeddings():
     print_status(True, f"embeddings table has {count} rows")
     return True
 
-def test_semantic_loops():
-    print_header("STEP 3: Testing Semantic Loop Detection")
+async def test_semantic_loops(out=None):
+    print_header("STEP 3: Testing Semantic Loop Detection", out)
 
     try:
-        result = subprocess.run(
-            [sys.executable, "semantic_loops.py"],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
+        result = await run_script(["semantic_loops.py"], timeout=30)
 
         if result.returncode == 0:
-            print_status(True, "semantic_loops.py executed successfully")
+            print_status(True, "semantic_loops.py executed successfully", out)
 
             if Path("semantic_loops.json").exists():
-                print_status(True, "semantic_loops.json created")
+                print_status(True, "semantic_loops.json created", out)
                 return True
             else:
-                print_status(False, "semantic_loops.json not created")
+                print_status(False, "semantic_loops.json not created", out)
                 return False
         else:
-            print_status(False, "semantic_loops.py failed")
-            print(f"\nError: {result.stderr}\n")
+            print_status(False, "semantic_loops.py failed", out)
+            print(f"\nError: {result.stderr}\n", file=out)
             return False
 
     except subprocess.TimeoutExpired:
-        print_status(False, "semantic_loops.py timed out (>30 seconds)")
+        print_status(False, "semantic_loops.py timed out (>30 seconds)", out)
         return False
     except Exception as e:
-        print_status(False, f"Error running semantic_loops.py: {e}")
+        print_status(False, f"Error running semantic_loops.py: {e}", out)
         return False
 
-def test_search():
-    print_header("STEP 4: Testing Semantic Search")
+async def test_search(out=None):
+    print_header("STEP 4: Testing Semantic Search", out)
 
     try:
-        result = subprocess.run(
-            [sys.executable, "search_loops.py", "test query"],
-            capture_output=True,
-            text=True,
-            timeout=15
-        )
+        result = await run_script(["search_loops.py", "test query"], timeout=15)
 
         if result.returncode == 0:
-            print_status(True, "search_loops.py executed successfully")
+            print_status(True, "search_loops.py executed successfully", out)
 
             if Path("search_results.json").exists():
-                print_status(True, "search_results.json created")
+                print_status(True, "search_results.json created", out)
                 return True
             else:
-                print_status(False, "search_results.json not created")
+                print_status(False, "search_results.json not created", out)
                 return False
         else:
-            print_status(False, "search_loops.py failed")
-            print(f"\nError: {result.stderr}\n")
+            print_status(False, "search_loops.py failed", out)
+            print(f"\nError: {result.stderr}\n", file=out)
             return False
 
     except subprocess.TimeoutExpired:
-        print_status(False, "search_loops.py timed out (>15 seconds)")
+        print_status(False, "search_loops.py timed out (>15 seconds)", out)
         return False
     except Exception as e:
-        print_status(False, f"Error running search_loops.py: {e}")
+        print_status(False, f"Error running search_loops.py: {e}", out)
         return False
 
-def test_clustering():
-    print_header("STEP 5: Testing Topic Clustering")
+async def test_clustering(out=None):
+    print_header("STEP 5: Testing Topic Clustering", out)
 
     try:
-        result = subprocess.run(
-            [sys.executable, "cluster_topics.py"],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
+        result = await run_script(["cluster_topics.py"], timeout=30)
 
         if result.returncode == 0:
-            print_status(True, "cluster_topics.py executed successfully")
+            print_status(True, "cluster_topics.py executed successfully", out)
 
             if Path("topic_clusters.json").exists():
-                print_status(True, "topic_clusters.json created")
+                print_status(True, "topic_clusters.json created", out)
                 return True
             else:
-                print_status(False, "topic_clusters.json not created")
+                print_status(False, "topic_clusters.json not created", out)
                 return False
         else:
-            print_status(False, "cluster_topics.py failed")
-            print(f"\nError: {result.stderr}\n")
+            print_status(False, "cluster_topics.py failed", out)
+            print(f"\nError: {result.stderr}\n", file=out)
             return False
 
     except subprocess.TimeoutExpired:
-        print_status(False, "cluster_topics.py timed out (>30 seconds)")
+        print_status(False, "cluster_topics.py timed out (>30 seconds)", out)
         return False
     except Exception as e:
-        print_status(False, f"Error running cluster_topics.py: {e}")
+        print_status(False, f"Error running cluster_topics.py: {e}", out)
         return False
 
+# Independent once the embeddings exist: each reads results.db and writes
+# its own JSON, so they run side by side
+PARALLEL_TESTS = [
+    ("Semantic Loops", test_semantic_loops),
+    ("Semantic Search", test_search),
+    ("Topic Clustering", test_clustering),
+]
+
+async def run_buffered(test):
+    """Run `test` with its report captured, so concurrent steps don't interleave."""
+    out = io.StringIO()
+    passed = await test(out)
+    return passed, out.getvalue()
+
+async def run_parallel():
+    """Run PARALLEL_TESTS concurrently on one event loop; (name, passed) in step order."""
+    tasks = [(name, asyncio.create_task(run_buffered(test))) for name, test in PARALLEL_TESTS]
+    results = []
+    # Reports are printed in step order, each as soon as it is ready
+    for name, task in tasks:
+        passed, report = await task
+        sys.stdout.write(report)
+        results.append((name, passed))
+    return results
+
 def main():
     print("\n" + "=" * 70)
     print("  VECTORIZATION SYSTEM TEST")
@@ -194,15 +279,15 @@ def main():
         print("\n⚠ Cannot continue without dependencies. Install and retry.\n")
         return False
 
-    results.append(("Embeddings", check_embeddings()))
+    # Names in the working directory, listed once for the precondition checks
+    present = {e.name for e in os.scandir(".")}
+    results.append(("Embeddings", check_embeddings(present)))
 
     if not results[-1][1]:
         print("\n⚠ Cannot continue without embeddings. Generate and retry.\n")
         return False
 
-    results.append(("Semantic Loops", test_semantic_loops()))
-    results.append(("Semantic Search", test_search()))
-    results.append(("Topic Clustering", test_clustering()))
+    results.extend(asyncio.run(run_parallel()))
 
     # Summary
     print_header("TEST SUMMARY")
@@ -315,7 +315,8 @@ def main():
                     "has_regex": has_regex,
                     "has_semantic": has_semantic,
                 },
-                "embedding": base64.b64encode(idea_embedding.tobytes()).decode("ascii"),
+                # float32 bytes: agent_deduplicator/agent_classifier decode with dtype=float32
+                "embedding": base64.b64encode(np.asarray(idea_embedding, dtype=np.float32).tobytes()).decode("ascii"),
             })
 
         if convo_ideas:
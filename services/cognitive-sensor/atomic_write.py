@@ -8,19 +8,19 @@ for same-volume renames (which temp files in same dir guarantee).
 import hashlib
 import json
 import os
+import shutil
 import tempfile
 from pathlib import Path
 from typing import Any
 
 
-def atomic_write_text(path: Path, content: str) -> None:
-    """Write content atomically via temp file + rename."""
+def _atomic_write(path: Path, content: str | bytes, mode: str, **open_kwargs: Any) -> None:
     parent = path.parent
     parent.mkdir(parents=True, exist_ok=True)
 
     fd, tmp_path = tempfile.mkstemp(dir=parent, suffix=".tmp")
     try:
-        with os.fdopen(fd, "w", encoding="utf-8") as f:
+        with os.fdopen(fd, mode, **open_kwargs) as f:
             f.write(content)
         os.replace(tmp_path, str(path))
     except BaseException:
@@ -31,6 +31,57 @@ def atomic_write_text(path: Path, content: str) -> None:
         raise
 
 
+def atomic_write_text(path: Path, content: str) -> None:
+    """Write content atomically via temp file + rename."""
+    _atomic_write(path, content, "w", encoding="utf-8")
+
+
+def atomic_write_bytes(path: Path, content: bytes) -> None:
+    """Write bytes atomically via temp file + rename."""
+    _atomic_write(path, content, "wb")
+
+
+def atomic_copy(src: Path, dst: Path) -> bool:
+    """Copy src to dst atomically, carrying over src's mtime.
+
+    Skips the copy (returns False) when dst already has src's size and
+    mtime, i.e. it was produced by a previous atomic_copy of the same file.
+    Uses os.sendfile where available so the data never passes through
+    Python buffers.
+    """
+    st = os.stat(src)
+    try:
+        dst_st = os.stat(dst)
+        if dst_st.st_size == st.st_size and dst_st.st_mtime_ns == st.st_mtime_ns:
+            return False
+    except FileNotFoundError:
+        pass
+
+    parent = Path(dst).parent
+    parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=parent, suffix=".tmp")
+    try:
+        with open(src, "rb") as fsrc, os.fdopen(fd, "wb") as fdst:
+            if hasattr(os, "sendfile"):
+                offset = 0
+                while offset < st.st_size:
+                    sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, st.st_size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+            else:
+                shutil.copyfileobj(fsrc, fdst)
+        os.utime(tmp_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        os.replace(tmp_path, str(dst))
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    return True
+
+
 def atomic_write_json(path: Path, data: Any, **kwargs: Any) -> None:
     """Write JSON atomically. Accepts same kwargs as json.dump (indent, etc)."""
     kwargs.setdefault("indent", 2)
@@ -18,6 +18,7 @@ from collections import defaultdict
 from sklearn.decomposition import PCA
 from sklearn.cluster import KMeans
 from sklearn.metrics.pairwise import cosine_similarity
+import embedding_store
 
 BASE = Path(__file__).parent.resolve()
 DB_FILE = BASE / "results.db"
@@ -60,7 +61,7 @@ def load_data():
 
     for cid, emb_blob, text_len, title, date, wc in rows:
         convo_ids.append(cid)
-        embeddings_list.append(np.frombuffer(emb_blob, dtype=np.float32))
+        embeddings_list.append(embedding_store.decode(emb_blob))
         titles.append(title if title else "(untitled)")
         dates.append(date if date else "")
         text_lengths.append(text_len if text_len else 0)
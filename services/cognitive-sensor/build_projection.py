@@ -6,13 +6,14 @@ import json
 from datetime import datetime
 from pathlib import Path
 from validate import require_valid
+from io_fast import load_json
 
 BASE = Path(__file__).parent.resolve()
 REPO = BASE.parent.parent
 OUT_DIR = REPO / "data" / "projections"
 
 # Load cognitive state
-cognitive = json.load(open(BASE / "cognitive_state.json", encoding="utf-8"))
+cognitive = load_json(BASE / "cognitive_state.json")
 
 # Compute directive (same logic as export_daily_payload.py)
 loops = cognitive["loops"]
@@ -0,0 +1,107 @@
+"""
+Generate _generated_validators.py from contracts/schemas/*.json.
+
+Each schema is turned into straight-line Python by
+fastjsonschema.compile_to_code(), so validate.py can use it on the first
+call instead of compiling the schema at runtime. Each entry also records a
+digest of the schema files it was built from; validate.py ignores stale
+entries (falling back to a runtime compile), and this script only rebuilds
+when some entry is stale. refresh.py runs it ahead of the exporters.
+
+Usage:
+    python build_validators.py           # rebuild if any schema changed
+    python build_validators.py --force   # rebuild unconditionally
+"""
+import re
+import sys
+import textwrap
+from pathlib import Path
+
+try:
+    import fastjsonschema
+    HAS_FASTJSONSCHEMA = True
+except ImportError:
+    HAS_FASTJSONSCHEMA = False
+
+from atomic_write import atomic_write_text
+from validate import COMPILE_OPTIONS, CONTRACTS, load_schema, schema_digest
+
+BASE = Path(__file__).parent.resolve()
+OUT = BASE / "_generated_validators.py"
+
+HEADER = '''"""
+Generated by build_validators.py from contracts/schemas/. Do not edit by hand.
+"""
+'''
+
+
+def factory_name(schema_name: str) -> str:
+    """DailyPayload.v1.json -> build_DailyPayload_v1"""
+    return "build_" + re.sub(r"\W", "_", schema_name.removesuffix(".json"))
+
+
+def generate_one(schema_name: str) -> tuple[str, tuple[str, ...]]:
+    """Source for one schema's validator, plus the schema files it depends on."""
+    used = [schema_name]
+
+    def handler(uri: str) -> dict:
+        used.append(uri)
+        return load_schema(uri)
+
+    code = fastjsonschema.compile_to_code(load_schema(schema_name),
+                                          handlers={"": handler}, **COMPILE_OPTIONS)
+    # The generated code is a module body: imports, regex tables, the root
+    # validator (the first def) and its helpers. Each schema gets its own
+    # factory scope so those names can't collide, and validate.py only pays
+    # for executing the ones it uses.
+    root = re.search(r"^def (\w+)\(", code, re.M).group(1)
+    src = (f"def {factory_name(schema_name)}():\n"
+           + textwrap.indent(code.rstrip("\n") + "\n", "    ")
+           + f"    return {root}\n")
+    return src, tuple(dict.fromkeys(used))
+
+
+def generate() -> str:
+    blocks, factories, sources = [], [], []
+    for path in sorted(CONTRACTS.glob("*.json")):
+        src, deps = generate_one(path.name)
+        blocks.append(src)
+        factories.append(f"    {path.name!r}: {factory_name(path.name)},\n")
+        sources.append(f"    {path.name!r}: ({schema_digest(deps)!r}, {deps!r}),\n")
+    return (HEADER + "\n\n" + "\n\n".join(blocks) + "\n\n"
+            + "# schema name -> function returning its validator\n"
+            + "FACTORIES = {\n" + "".join(factories) + "}\n\n"
+            + "# schema name -> (digest of its source files, those files)\n"
+            + "SOURCES = {\n" + "".join(sources) + "}\n")
+
+
+def is_current() -> bool:
+    """True if the generated module covers exactly the current schemas, none stale."""
+    try:
+        from _generated_validators import SOURCES as sources
+    except ImportError:
+        return False
+    if set(sources) != {p.name for p in CONTRACTS.glob("*.json")}:
+        return False
+    try:
+        return all(schema_digest(names) == digest for digest, names in sources.values())
+    except OSError:
+        return False
+
+
+def main() -> None:
+    if not HAS_FASTJSONSCHEMA:
+        # Optional dependency: validate.py falls back to jsonschema
+        print("fastjsonschema not installed, skipping")
+        return
+    if "--force" not in sys.argv[1:] and is_current():
+        print(f"{OUT.name} is up to date")
+        return
+    code = generate()
+    compile(code, str(OUT), "exec")  # fail before writing anything broken
+    atomic_write_text(OUT, code)
+    print(f"Wrote {OUT.name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,11 @@
-import sqlite3, json
+import json
+from pathlib import Path
 from datetime import datetime, timedelta
+from db import connect
 
-DB = sqlite3.connect("results.db")
+BASE = Path(__file__).parent.resolve()
+
+DB = connect(BASE / "results.db")
 cur = DB.cursor()
 
 def query(q, args=()):
@@ -17,7 +21,7 @@ def get_state():
 
 def get_open_loops(limit=5):
     try:
-        loops = json.load(open("loops_latest.json", encoding="utf-8"))
+        loops = json.load(open(BASE / "loops_latest.json", encoding="utf-8"))
         # Filter out closed/archived
         closed = {r[0] for r in query("SELECT convo_id FROM loop_decisions WHERE decision IN ('CLOSE', 'ARCHIVE')")}
         loops = [l for l in loops if l["convo_id"] not in closed]
@@ -27,7 +31,7 @@ def get_open_loops(limit=5):
 
 def get_closure_backlog():
     try:
-        loops = json.load(open("loops_latest.json", encoding="utf-8"))
+        loops = json.load(open(BASE / "loops_latest.json", encoding="utf-8"))
         closed_ids = {r[0] for r in query("SELECT convo_id FROM loop_decisions WHERE decision IN ('CLOSE','ARCHIVE')")}
         open_loops = len([l for l in loops if l["convo_id"] not in closed_ids])
     except:
@@ -54,18 +58,24 @@ def get_closure_backlog():
     }
 
 def get_drift():
+    # Resolve the 90-day cutoff once and bind it, rather than leaving a
+    # subquery in the WHERE clause for the planner to re-evaluate per row.
+    cutoff = query("SELECT date(MAX(date), '-90 day') FROM convo_time")[0][0]
     recent = query("""
         SELECT topic, SUM(weight) FROM topics t
         JOIN convo_time c ON t.convo_id = c.convo_id
-        WHERE c.date >= (SELECT date(MAX(date), '-90 day') FROM convo_time)
+        WHERE c.date >= ?
         GROUP BY topic ORDER BY SUM(weight) DESC LIMIT 10
-    """)
+    """, (cutoff,))
     return dict(recent)
 
-if __name__ == "__main__":
-    print(json.dumps({
+def build_state():
+    return {
         "state": get_state(),
         "loops": get_open_loops(),
         "drift": get_drift(),
         "closure": get_closure_backlog()
-    }, indent=2))
+    }
+
+if __name__ == "__main__":
+    print(json.dumps(build_state(), indent=2))
@@ -1,20 +1,26 @@
-import sqlite3
 from datetime import datetime, timedelta
+from db import connect
+from io_fast import dump_json
 
-con = sqlite3.connect("results.db")
+con = connect("results.db")
 cur = con.cursor()
 
 today = datetime.now().strftime("%Y-%m-%d")
 week_ago = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
 
+# decision leads so both the weekly and lifetime counts are index-only scans
+cur.execute("CREATE INDEX IF NOT EXISTS idx_ldec_decision_date ON loop_decisions(decision, date)")
+con.commit()
+
 week = cur.execute("""
 SELECT decision, COUNT(*) FROM loop_decisions
-WHERE date >= ?
+WHERE decision IN ('CLOSE','ARCHIVE') AND date >= ?
 GROUP BY decision
 """, (week_ago,)).fetchall()
 
 lifetime = cur.execute("""
 SELECT decision, COUNT(*) FROM loop_decisions
+WHERE decision IN ('CLOSE','ARCHIVE')
 GROUP BY decision
 """).fetchall()
 
@@ -36,7 +42,6 @@ payload = {
     "closure_ratio": ratio
 }
 
-import json
-open("completion_stats.json","w").write(json.dumps(payload,indent=2))
+dump_json("completion_stats.json", payload)
 
 print("completion_stats.json updated.")
@@ -0,0 +1,36 @@
+"""
+Shared SQLite connection setup for cognitive-sensor scripts.
+
+WAL lets readers (cognitive_api, completion_stats) run while an init
+script is writing, and mmap turns point reads into memory loads instead
+of read() syscalls. synchronous=NORMAL is durable under WAL except on
+power loss, which is acceptable for a derived results.db.
+"""
+import sqlite3
+from pathlib import Path
+
+PRAGMAS = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA mmap_size=268435456;
+PRAGMA cache_size=-131072;
+"""
+
+
+def connect(path: str | Path = "results.db") -> sqlite3.Connection:
+    """Open a connection to results.db (or `path`) with the tuned PRAGMAs applied."""
+    con = sqlite3.connect(path)
+    con.executescript(PRAGMAS)
+    return con
+
+
+def temp_set(con: sqlite3.Connection, name: str, values) -> None:
+    """Load `values` into TEMP table `name` (one TEXT PRIMARY KEY column).
+
+    Queries can then test membership with `col IN name`, which SQLite
+    answers from the table's index instead of a long bound IN (?, ...) list.
+    """
+    con.execute(f"CREATE TEMP TABLE IF NOT EXISTS {name} (t TEXT PRIMARY KEY)")
+    con.execute(f"DELETE FROM temp.{name}")
+    con.executemany(f"INSERT OR IGNORE INTO temp.{name} VALUES (?)", ((v,) for v in values))
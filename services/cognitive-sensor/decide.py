@@ -1,16 +1,36 @@
-import sqlite3
 import subprocess
 import urllib.request
 import json
 import os
 from datetime import datetime
+from db import connect
 
-con = sqlite3.connect("results.db")
+def read_after_last(path, marker, block=4096):
+    """Return the text after the last `marker` in `path`, scanning back from EOF.
+
+    RESURFACER_LOG.md is append-only, so the latest entry sits in the tail;
+    this reads only as many blocks as it takes to reach the marker.
+    """
+    needle = marker.encode("utf-8")
+    with open(path, "rb") as f:
+        pos = f.seek(0, 2)
+        buf = b""
+        while pos > 0:
+            step = min(block, pos)
+            pos -= step
+            f.seek(pos)
+            buf = f.read(step) + buf
+            i = buf.rfind(needle)
+            if i != -1:
+                return buf[i + len(needle):].decode("utf-8")
+    return buf.decode("utf-8")
+
+con = connect("results.db")
 cur = con.cursor()
 
 # Get most recent resurfaced loop
 try:
-    text = open("RESURFACER_LOG.md", encoding="utf-8").read().strip().split("UNRESOLVED LOOP:")[-1]
+    text = read_after_last("RESURFACER_LOG.md", "UNRESOLVED LOOP:").rstrip()
     title = text.split("\n")[1].strip()
 except:
     print("No resurfaced loop found.")
@@ -0,0 +1,122 @@
+"""
+BLOB encoding for the conversation-level `embeddings` table in results.db.
+
+Rows are stored as symmetric int8 with one float32 scale per vector
+(388 B for a 384-dim vector instead of 1536 B as float32), which quarters
+the table, the page-cache footprint, and the bytes every reader pulls
+through SQLite. K-means and cosine ranking are insensitive to the lost
+precision. Readers always get float32 back, so sklearn/numpy callers don't
+change.
+
+Rows written earlier are float32 or float16; decode() tells the three
+layouts apart by BLOB length, so an existing results.db keeps working
+without regeneration.
+
+export_matrix() additionally dumps the whole table as one float32
+embeddings.npy (plus embeddings_ids.npy) that readers memory-map through
+matrix_for() instead of decoding a BLOB per row. init_embeddings.py
+refreshes it; readers fall back to the BLOBs when it is missing, its ids
+don't cover what they asked for, or the table has been rewritten since
+(the export is stamped with a fingerprint of the rows it was built from).
+"""
+import hashlib
+import os
+from pathlib import Path
+
+import numpy as np
+
+EMBEDDING_DIM = 384
+MATRIX_PATH = Path("embeddings.npy")
+STORE_DTYPE = "int8"
+_SCALE_BYTES = 4  # float32 scale prefix of an int8 row
+
+
+def encode(vec: np.ndarray) -> bytes:
+    """Serialize an embedding for the embeddings.embedding column."""
+    vec = np.asarray(vec, dtype=np.float32)
+    # Per-vector absmax scale: the largest component maps to +/-127
+    scale = np.float32(np.abs(vec).max() / 127) if vec.any() else np.float32(1)
+    q = np.clip(np.round(vec / scale), -127, 127).astype(np.int8)
+    return scale.tobytes() + q.tobytes()
+
+
+def decode(blob: bytes) -> np.ndarray:
+    """Deserialize an embeddings.embedding BLOB to a float32 vector."""
+    if len(blob) == EMBEDDING_DIM + _SCALE_BYTES:
+        scale = np.frombuffer(blob, dtype=np.float32, count=1)[0]
+        return np.frombuffer(blob, dtype=np.int8, offset=_SCALE_BYTES).astype(np.float32) * scale
+    if len(blob) == EMBEDDING_DIM * 2:
+        return np.frombuffer(blob, dtype=np.float16).astype(np.float32)
+    return np.frombuffer(blob, dtype=np.float32)
+
+
+def _ids_path(path: Path) -> Path:
+    return path.with_name(path.stem + "_ids.npy")
+
+
+def _fingerprint_path(path: Path) -> Path:
+    return path.with_name(path.stem + "_fingerprint.txt")
+
+
+def table_fingerprint(con) -> str:
+    """Digest of every embeddings row's rowid, convo_id and created_at.
+
+    Rebuilding the table (DELETE + re-insert, or a fresh results.db) gives
+    new created_at values even when the ids come out the same. The BLOBs
+    themselves aren't read.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for row in con.execute("SELECT rowid, convo_id, created_at FROM embeddings ORDER BY rowid"):
+        h.update(repr(row).encode())
+    return h.hexdigest()
+
+
+def export_matrix(con, path: Path | str = MATRIX_PATH) -> int:
+    """Write every embeddings row, in rowid order, to `path` as an (N, D) float32 .npy."""
+    path = Path(path)
+    rows = con.execute("SELECT convo_id, embedding FROM embeddings ORDER BY rowid").fetchall()
+    tmp = path.with_name(path.name + ".tmp")
+    E = np.lib.format.open_memmap(tmp, mode="w+", dtype=np.float32,
+                                  shape=(len(rows), EMBEDDING_DIM))
+    for i, (_, blob) in enumerate(rows):
+        E[i] = decode(blob)
+    E.flush()
+    del E
+    ids_tmp = _ids_path(tmp)
+    with open(ids_tmp, "wb") as f:
+        np.save(f, np.array([cid for cid, _ in rows], dtype=str))
+    os.replace(tmp, path)
+    os.replace(ids_tmp, _ids_path(path))
+    # Written last: an interrupted export leaves a stale stamp, never a
+    # current stamp on stale data
+    stamp_tmp = _fingerprint_path(tmp)
+    stamp_tmp.write_text(table_fingerprint(con), encoding="utf-8")
+    os.replace(stamp_tmp, _fingerprint_path(path))
+    return len(rows)
+
+
+def matrix_for(con, cids: list[str], path: Path | str = MATRIX_PATH) -> np.ndarray | None:
+    """Embeddings for `cids`, in order, from the exported matrix, or None if unavailable.
+
+    None also when the export wasn't built from the current contents of
+    con's embeddings table. When `cids` is exactly the exported order the
+    read-only memmap itself is returned (no copy); otherwise the requested
+    rows are gathered.
+    """
+    path = Path(path)
+    try:
+        if _fingerprint_path(path).read_text(encoding="utf-8") != table_fingerprint(con):
+            return None
+        ids = np.load(_ids_path(path))
+        E = np.load(path, mmap_mode="r")
+    except (OSError, ValueError):
+        return None
+    if len(ids) != len(E):
+        return None
+    if len(ids) == len(cids) and (ids == np.array(cids, dtype=str)).all():
+        return E
+    pos = {cid: i for i, cid in enumerate(ids.tolist())}
+    try:
+        return E[[pos[cid] for cid in cids]]
+    except KeyError:
+        return None
@@ -1,15 +1,14 @@
-import json
-import subprocess
 from pathlib import Path
+from cognitive_api import build_state
 from validate import require_valid
-from atomic_write import atomic_write_json
+from atomic_write import atomic_write_bytes
+from io_fast import dumps
 from lifecycle_summary import summarize, manifest_statuses
 
 BASE = Path(__file__).parent.resolve()
 
 # Generate cognitive state from API
-out = subprocess.check_output(["python", str(BASE / "cognitive_api.py")], cwd=BASE)
-state = json.loads(out)
+state = build_state()
 
 # Enrich with lifecycle data so downstream readers see status + artifact links
 manifests = manifest_statuses()
@@ -27,6 +26,6 @@ state["lifecycle"] = summarize(window_days=1)
 require_valid(state, "CognitiveMetricsComputed.json", "export_cognitive_state")
 
 # Write validated output (atomic to prevent partial reads)
-atomic_write_json(BASE / "cognitive_state.json", state)
+atomic_write_bytes(BASE / "cognitive_state.json", dumps(state))
 
 print("Exported cognitive_state.json (contract validated, lifecycle enriched).")
@@ -1,14 +1,14 @@
-import json
 from datetime import datetime
 from pathlib import Path
 from validate import require_valid
 from atlas_config import compute_mode
-from atomic_write import atomic_write_json
+from atomic_write import atomic_write_bytes
+from io_fast import dumps, load_json
 
 BASE = Path(__file__).parent.resolve()
 
 # Load cognitive state (source of truth)
-state = json.load(open(BASE / "cognitive_state.json", encoding="utf-8"))
+state = load_json(BASE / "cognitive_state.json")
 
 loops = state["loops"]
 closure = state["closure"]
@@ -44,7 +44,7 @@ payload = {
 pred_path = BASE / "prediction_results.json"
 try:
     if pred_path.exists():
-        pred_data = json.load(open(pred_path, encoding="utf-8"))
+        pred_data = load_json(pred_path)
         payload["predictions"] = {
             "status": pred_data.get("status", "unavailable"),
             "top_actions": pred_data.get("top_actions", [])[:3],
@@ -60,10 +60,11 @@ require_valid(payload, "DailyPayload.v1.json", "export_daily_payload")
 
 # Destination: CycleBoard nervous system (repo-local)
 OUT = BASE / "cycleboard" / "brain" / "daily_payload.json"
-atomic_write_json(OUT, payload)
+encoded = dumps(payload)
+atomic_write_bytes(OUT, encoded)
 
 # Also write to local directory for easy access
 LOCAL_OUT = BASE / "daily_payload.json"
-atomic_write_json(LOCAL_OUT, payload)
+atomic_write_bytes(LOCAL_OUT, encoded)
 
 print(f"Daily payload exported to {OUT} (contract validated).")
@@ -0,0 +1,133 @@
+"""
+Single-pass loader for the messages, convo_titles and topics tables.
+
+Walks memory_db.json once and fills all three tables in one transaction,
+instead of three scripts each re-reading and re-traversing every message.
+init_results_db.py, init_titles.py and init_topics.py remain as entry
+points that load just their own table through run(), so the documented
+step-by-step rebuild keeps working.
+
+Usage:
+    python init_all.py
+"""
+import string
+from collections import Counter
+from pathlib import Path
+from db import connect
+from memory_loader import iter_memory
+
+DB_JSON = Path("memory_db.json")
+OUT_DB = Path("results.db")
+TABLES = ("messages", "convo_titles", "topics")
+
+SCHEMA = {
+    "messages": """
+CREATE TABLE IF NOT EXISTS messages (
+    convo_id TEXT,
+    role TEXT,
+    words INTEGER,
+    chars INTEGER
+)
+""",
+    "convo_titles": """
+CREATE TABLE IF NOT EXISTS convo_titles (
+    convo_id TEXT,
+    title TEXT
+)
+""",
+    "topics": """
+CREATE TABLE IF NOT EXISTS topics (
+    convo_id TEXT,
+    topic TEXT,
+    weight INTEGER
+)
+""",
+}
+
+# Per-convo lookups in loops/resurfacer/radar filter on convo_id
+INDEXES = {
+    "messages": ["CREATE INDEX IF NOT EXISTS idx_messages_cid_role ON messages(convo_id, role)"],
+    "convo_titles": ["CREATE INDEX IF NOT EXISTS idx_titles_cid ON convo_titles(convo_id)"],
+    "topics": ["CREATE INDEX IF NOT EXISTS idx_topics_cid ON topics(convo_id)"],
+}
+
+INSERT = {
+    "messages": "INSERT INTO messages VALUES (?,?,?,?)",
+    "convo_titles": "INSERT INTO convo_titles VALUES (?,?)",
+    "topics": "INSERT INTO topics VALUES (?,?,?)",
+}
+
+STOP = set("""
+the and a to of in for on with is are was were be been being it that this i you he she they we my your our me him her them
+""".split())
+
+_KEEP = frozenset(string.ascii_lowercase + string.digits + " ")
+
+class _SpaceOutTable(dict):
+    """str.translate table: [a-z0-9 ] pass through, any other code point becomes a space.
+
+    Filled lazily so arbitrary Unicode input is covered; each code point
+    costs one Python call the first time it is seen, then it's a C lookup.
+    """
+    def __missing__(self, cp):
+        self[cp] = cp if chr(cp) in _KEEP else " "
+        return self[cp]
+
+_TBL = _SpaceOutTable()
+
+def normalize(t):
+    # Lowercase first, so uppercase letters survive as a-z
+    words = str(t).lower().translate(_TBL).split()
+    return [w for w in words if w not in STOP and len(w) > 2]
+
+def text_stats(txt):
+    """(words, chars) for a message body; dict/other bodies count as their str()."""
+    s = txt if isinstance(txt, str) else str(txt)
+    return len(s.split()), len(s)
+
+def message_rows(cid, c):
+    return [(cid, m["role"], *text_stats(m.get("text", ""))) for m in c["messages"]]
+
+def topic_rows(cid, c):
+    words = []
+    for m in c["messages"]:
+        words += normalize(m.get("text",""))
+    counts = Counter(words)
+    return [(cid, w, cnt) for w, cnt in counts.most_common(10)]
+
+def title_rows(cid, c):
+    return [(cid, c.get("title","").strip())]
+
+ROWS = {"messages": message_rows, "convo_titles": title_rows, "topics": topic_rows}
+
+def run(tables=TABLES, db_path=OUT_DB, json_path=DB_JSON):
+    """Load `tables` from memory_db.json in one pass; return row counts per table."""
+    con = connect(db_path)
+    cur = con.cursor()
+    for t in tables:
+        cur.execute(SCHEMA[t])
+        for stmt in INDEXES.get(t, []):
+            cur.execute(stmt)
+
+    print("Loading memory_db.json...")
+    counts = dict.fromkeys(tables, 0)
+    # One transaction for all tables; titles are replaced, not appended.
+    # Rows go to SQLite per conversation as the stream is parsed, so only
+    # one conversation's rows are ever held in memory.
+    with con:
+        if "convo_titles" in tables:
+            cur.execute("DELETE FROM convo_titles")
+        for idx, c in enumerate(iter_memory(json_path)):
+            cid = str(idx)  # Index-based ID shared with convo_time and embeddings
+            for t in tables:
+                rows = ROWS[t](cid, c)
+                cur.executemany(INSERT[t], rows)
+                counts[t] += len(rows)
+    cur.execute("ANALYZE")  # refresh planner stats so the indexes get used
+    con.close()
+
+    return counts
+
+if __name__ == "__main__":
+    counts = run()
+    print("results.db loaded:", ", ".join(f"{t}={n}" for t, n in counts.items()))
@@ -1,13 +1,14 @@
-import json, sqlite3, os
+import json, os
 from pathlib import Path
 from datetime import datetime
+from db import connect
 
 # Base directory is the same folder as this script
 BASE = Path(__file__).parent.resolve()
 
 # RAW_JSON: Set via environment variable or place conversations.json in this folder
 RAW_JSON = Path(os.environ.get("CONVERSATIONS_JSON", BASE / "conversations.json"))
-DB = sqlite3.connect(BASE / "results.db")
+DB = connect(BASE / "results.db")
 cur = DB.cursor()
 
 cur.execute("""
@@ -16,6 +17,8 @@ CREATE TABLE IF NOT EXISTS convo_time (
     date TEXT
 )
 """)
+cur.execute("CREATE INDEX IF NOT EXISTS idx_ctime_cid ON convo_time(convo_id)")
+cur.execute("CREATE INDEX IF NOT EXISTS idx_ctime_date ON convo_time(date)")
 
 print("Loading raw conversations.json...")
 data = json.load(open(RAW_JSON, encoding="utf-8"))
@@ -45,6 +48,7 @@ for idx, c in enumerate(data):
 
 cur.executemany("INSERT INTO convo_time VALUES (?,?)", rows)
 DB.commit()
+cur.execute("ANALYZE")
 DB.close()
 
 print("Loaded", len(rows), "conversation dates.")
@@ -1,7 +1,10 @@
-import json, sqlite3, numpy as np
+import os, numpy as np
 from pathlib import Path
 from datetime import datetime
 from model_cache import get_model, get_model_name
+from db import connect
+import embedding_store
+from memory_loader import load_memory
 
 # Configuration
 DB_JSON = Path("memory_db.json")
@@ -13,8 +16,13 @@ print("Loading sentence-transformers model...")
 print(f"Initializing model: {get_model_name()}")
 model = get_model()
 
+# model_cache already put the model on the GPU (fp16) if there is one; on CPU use every core
+import torch
+if model.device.type == "cpu":
+    torch.set_num_threads(os.cpu_count() or 1)
+
 # Create embeddings table
-con = sqlite3.connect(OUT_DB)
+con = connect(OUT_DB)
 cur = con.cursor()
 
 cur.execute("""
@@ -23,9 +31,13 @@ CREATE TABLE IF NOT EXISTS embeddings (
     embedding BLOB,
     model TEXT,
     created_at TEXT,
-    text_length INTEGER
+    text_length INTEGER,
+    dtype TEXT
 )
 """)
+# Tables created before the dtype tag existed hold float32 rows
+if "dtype" not in {r[1] for r in cur.execute("PRAGMA table_info(embeddings)")}:
+    cur.execute("ALTER TABLE embeddings ADD COLUMN dtype TEXT DEFAULT 'float32'")
 
 # Check if embeddings already exist
 existing = cur.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
@@ -39,7 +51,7 @@ if existing > 0:
 
 # Load conversations
 print(f"Loading {DB_JSON}...")
-data = json.load(open(DB_JSON, encoding="utf-8"))
+data = load_memory(DB_JSON)
 total = len(data)
 
 print(f"Generating embeddings for {total} conversations...")
@@ -63,15 +75,16 @@ for idx, convo in enumerate(data):
     text_for_embedding = full_text[:MAX_TEXT_LENGTH]
 
     # Generate embedding
-    embedding = model.encode(text_for_embedding, show_progress_bar=False)
+    embedding = model.encode(text_for_embedding, show_progress_bar=False, convert_to_numpy=True)
 
-    # Store as binary blob
+    # Store as int8 blob with a per-vector scale (see embedding_store)
     rows.append((
         cid,
-        embedding.tobytes(),
+        embedding_store.encode(embedding),
         get_model_name(),
         datetime.now().isoformat(),
-        len(full_text)
+        len(full_text),
+        embedding_store.STORE_DTYPE
     ))
 
     # Progress indicator
@@ -80,14 +93,16 @@ for idx, convo in enumerate(data):
 
 # Insert all at once
 print("\nSaving to database...")
-cur.executemany("INSERT INTO embeddings VALUES (?,?,?,?,?)", rows)
+cur.executemany("INSERT INTO embeddings VALUES (?,?,?,?,?,?)", rows)
 con.commit()
+# Contiguous copy for readers to memory-map (see embedding_store.export_matrix)
+embedding_store.export_matrix(con)
 con.close()
 
 print(f"\n✓ Successfully generated {len(rows)} embeddings")
 print(f"  Model: {get_model_name()}")
 print(f"  Dimensions: 384")
-print(f"  Database size increase: ~{len(rows) * 384 * 4 / 1024 / 1024:.1f} MB")
+print(f"  Database size increase: ~{len(rows) * (384 + 4) / 1024 / 1024:.1f} MB")
 print("\nNext steps:")
 print("  - Run: python semantic_loops.py")
 print("  - Run: python search_loops.py <query>")
@@ -15,7 +15,7 @@ Usage:
 import json, sqlite3, numpy as np
 from pathlib import Path
 from datetime import datetime
-from model_cache import get_model, get_model_name
+from model_cache import get_model, get_model_name, encode
 
 BASE = Path(__file__).parent.resolve()
 DB_JSON = BASE / "memory_db.json"
@@ -124,7 +124,7 @@ def main():
         texts = [m[4][:MAX_TEXT_CHARS] for m in batch]
 
         # Encode batch
-        embeddings = model.encode(texts, batch_size=BATCH_SIZE, show_progress_bar=False)
+        embeddings = encode(texts, batch_size=BATCH_SIZE)  # float32 even on an fp16 GPU model
 
         # Build rows
         for i, m in enumerate(batch):
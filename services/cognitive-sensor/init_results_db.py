@@ -1,37 +1,6 @@
-import json, sqlite3
-from pathlib import Path
+"""Build the messages table from memory_db.json. See init_all.py."""
+from init_all import run
 
-DB_JSON = Path("memory_db.json")
-OUT_DB = Path("results.db")
+counts = run(("messages",))
 
-print("Loading memory_db.json...")
-data = json.load(open(DB_JSON, encoding="utf-8"))
-
-con = sqlite3.connect(OUT_DB)
-cur = con.cursor()
-
-cur.execute("""
-CREATE TABLE IF NOT EXISTS messages (
-    convo_id TEXT,
-    role TEXT,
-    words INTEGER,
-    chars INTEGER
-)
-""")
-
-rows = []
-for idx, c in enumerate(data):
-    cid = str(idx)  # Use same index-based ID as convo_time and topics
-    for m in c["messages"]:
-        txt = m.get("text", "")
-        if isinstance(txt, dict):
-            txt = str(txt)
-        words = len(str(txt).split())
-        chars = len(str(txt))
-        rows.append((cid, m["role"], words, chars))
-
-cur.executemany("INSERT INTO messages VALUES (?,?,?,?)", rows)
-con.commit()
-con.close()
-
-print("results.db created with", len(rows), "rows.")
+print("results.db created with", counts["messages"], "rows.")
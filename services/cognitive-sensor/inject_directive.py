@@ -81,30 +81,34 @@ directive_script = '''
   </script>
 '''
 
-# Insert banner right after opening <body> tag
+# Banner goes right after the opening <body> tag, script right before </body>.
+# Locate both in the original, then assemble the output with one join
+# instead of two full-document slice-and-concatenate copies.
 body_insert_point = html.find('<body class="bg-slate-50">')
 if body_insert_point != -1:
     # Find the end of the body tag
     body_end = html.find('>', body_insert_point) + 1
-    # Insert the directive banner
-    html = html[:body_end] + directive_banner + html[body_end:]
     print("[OK] Inserted directive banner")
 else:
     print("[FAIL] Could not find <body> tag")
     exit(1)
 
-# Insert script before closing </body> tag
 body_close = html.rfind('</body>')
 if body_close != -1:
-    html = html[:body_close] + directive_script + html[body_close:]
     print("[OK] Inserted directive loader script")
 else:
     print("[FAIL] Could not find </body> tag")
     exit(1)
 
-# Write output
+html = "".join([
+    html[:body_end], directive_banner,
+    html[body_end:body_close], directive_script,
+    html[body_close:],
+])
+
+# Write output (bytes: written exactly as assembled, no newline translation)
 OUTPUT.parent.mkdir(exist_ok=True)
-OUTPUT.write_text(html, encoding="utf-8")
+OUTPUT.write_bytes(html.encode("utf-8"))
 print(f"[OK] Created cognitive-aware CycleBoard at:")
 print(f"     {OUTPUT}")
 print("\nOpen this file in your browser to see your cognitive directive banner.")
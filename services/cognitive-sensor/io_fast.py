@@ -0,0 +1,45 @@
+"""
+JSON encode/decode helpers for cognitive-sensor scripts.
+
+Uses orjson when installed (Rust parser/encoder, several times faster than
+the stdlib and able to serialize numpy scalars/arrays directly); falls back
+to stdlib json with the same 2-space indent so output stays diffable either
+way. Loading from bytes skips the text-mode decoder that json.load(open())
+goes through, which matters most for the large memory_db.json.
+"""
+import json
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+if HAS_ORJSON:
+    _DUMP_OPTS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON from bytes or str."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_json(path: Path | str) -> Any:
+    """Read and parse a JSON file."""
+    return loads(Path(path).read_bytes())
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode obj as indented UTF-8 JSON bytes."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=_DUMP_OPTS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def dump_json(path: Path | str, obj: Any) -> None:
+    """Write obj to path as indented JSON (non-atomic; see atomic_write for that)."""
+    Path(path).write_bytes(dumps(obj))
@@ -2,6 +2,8 @@ import sqlite3, json
 from pathlib import Path
 from atlas_config import ROUTING
 from atomic_write import atomic_write_json
+from io_fast import load_json
+from db import temp_set
 
 INTENT_TOPICS = set("want need should plan going gonna start try trying build create make learn begin".split())
 DONE_TOPICS   = set("did done finished completed solved shipped fixed achieved".split())
@@ -25,7 +27,7 @@ except sqlite3.OperationalError:
 closed_path = Path("loops_closed.json")
 if closed_path.exists():
     try:
-        closed_entries = json.load(open(closed_path, encoding="utf-8"))
+        closed_entries = load_json(closed_path)
         for entry in closed_entries:
             lid = entry.get("loop_id", "")
             if lid:
@@ -33,28 +35,38 @@ if closed_path.exists():
     except (json.JSONDecodeError, KeyError):
         pass  # best-effort — file may be empty or malformed
 
-rows = cur.execute("SELECT convo_id, role, words FROM messages").fetchall()
+# One pass: per-convo user words, intent/done topic weights and title.
+# Aggregate each table before joining so duplicate rows can't fan out.
+# Topic sets live in temp tables so membership is an index lookup.
+temp_set(con, "intent_topics", INTENT_TOPICS)
+temp_set(con, "done_topics", DONE_TOPICS)
+rows = cur.execute("""
+SELECT u.convo_id, u.user_words, COALESCE(k.intent_w, 0), COALESCE(k.done_w, 0), ct.title
+FROM (
+    SELECT convo_id, SUM(CASE WHEN role = 'user' THEN words ELSE 0 END) AS user_words,
+           MIN(rowid) AS first_row
+    FROM messages GROUP BY convo_id
+) u
+LEFT JOIN (
+    SELECT convo_id,
+           SUM(CASE WHEN topic IN intent_topics THEN weight ELSE 0 END) AS intent_w,
+           SUM(CASE WHEN topic IN done_topics THEN weight ELSE 0 END) AS done_w
+    FROM topics GROUP BY convo_id
+) k ON k.convo_id = u.convo_id
+LEFT JOIN (
+    SELECT convo_id, title, MIN(rowid) FROM convo_titles GROUP BY convo_id
+) ct ON ct.convo_id = u.convo_id
+ORDER BY u.first_row
+""").fetchall()
 
-by_convo = {}
-for cid, role, words in rows:
+results = []
+for cid, user_words, intent_w, done_w, title in rows:
     if cid in decided:
         continue
-    by_convo.setdefault(cid, {"user_words": 0})
-    if role == "user":
-        by_convo[cid]["user_words"] += words
-
-results = []
-for cid, info in by_convo.items():
-    user_words = info["user_words"]
-
-    trows = cur.execute("SELECT topic, weight FROM topics WHERE convo_id=?", (cid,)).fetchall()
-    intent_w = sum(w for t, w in trows if t in INTENT_TOPICS)
-    done_w   = sum(w for t, w in trows if t in DONE_TOPICS)
 
     score = user_words + intent_w * 30 - done_w * 50
 
-    title = cur.execute("SELECT title FROM convo_titles WHERE convo_id=?", (cid,)).fetchone()
-    title = title[0] if title else "(untitled)"
+    title = title if title is not None else "(untitled)"
 
     results.append((cid, title, int(score)))
 
@@ -0,0 +1,93 @@
+"""
+Shared loader for memory_db.json with a pickle sidecar.
+
+Several pipeline stages (init_results_db, init_titles, init_topics,
+init_embeddings, language_loops, profile_report) each parse the same large
+memory_db.json. The first load writes memory_db.pkl next to it; later loads
+unpickle that instead, which skips JSON tokenization and UTF-8 validation.
+The sidecar starts with the (size, mtime_ns) of the JSON it was built
+from and is rebuilt unless that still matches exactly, so a JSON swapped
+in by mv, cp -p, rsync or a checkout is never shadowed by an old pickle.
+
+Single-pass consumers can use iter_memory() instead, which streams one
+conversation at a time with ijson (when installed) so peak memory stays at
+one conversation rather than the whole export.
+"""
+import pickle
+from pathlib import Path
+from typing import Any, Iterator
+
+from atomic_write import atomic_write_bytes
+from io_fast import load_json
+
+try:
+    import ijson
+    try:
+        ijson = ijson.get_backend("yajl2_c")  # C backend is several times faster
+    except ImportError:
+        pass
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+DB_JSON = Path("memory_db.json")
+
+
+def _stamp(path: Path) -> tuple[int, int]:
+    st = path.stat()
+    return st.st_size, st.st_mtime_ns
+
+
+def _read_sidecar(path: Path, sidecar: Path, header_only: bool = False) -> Any:
+    """Sidecar contents (True if header_only) if it matches path, else None.
+
+    The sidecar is two pickles back to back: the source stamp, then the data.
+    """
+    try:
+        stamp = _stamp(path)
+        with open(sidecar, "rb") as f:
+            if pickle.load(f) != stamp:
+                return None
+            return True if header_only else pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None  # missing or unreadable sidecar: fall back to JSON
+
+
+def _sidecar_fresh(path: Path, sidecar: Path) -> bool:
+    return _read_sidecar(path, sidecar, header_only=True) is not None
+
+
+def load_memory(path: Path | str = DB_JSON) -> list[dict[str, Any]]:
+    """Return the parsed conversation list from memory_db.json (or `path`)."""
+    path = Path(path)
+    sidecar = path.with_suffix(".pkl")
+    data = _read_sidecar(path, sidecar)
+    if data is not None:
+        return data
+
+    # Stamp before parsing: if the JSON changes mid-read, the stamp won't
+    # match it afterwards and the next load rebuilds
+    stamp = _stamp(path)
+    data = load_json(path)
+    try:
+        atomic_write_bytes(sidecar,
+                           pickle.dumps(stamp, protocol=pickle.HIGHEST_PROTOCOL)
+                           + pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+    except OSError:
+        pass  # read-only directory: the JSON parse still succeeded
+    return data
+
+
+def iter_memory(path: Path | str = DB_JSON) -> Iterator[dict[str, Any]]:
+    """Yield conversations from memory_db.json (or `path`) one at a time.
+
+    A fresh pickle sidecar is still the fastest source, so it wins when
+    present. Otherwise conversations are streamed with ijson; without
+    ijson this degrades to load_memory().
+    """
+    path = Path(path)
+    if HAS_IJSON and not _sidecar_fresh(path, path.with_suffix(".pkl")):
+        with open(path, "rb") as f:
+            yield from ijson.items(f, "item", use_float=True)
+        return
+    yield from load_memory(path)
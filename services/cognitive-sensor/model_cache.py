@@ -1,10 +1,20 @@
 """
 Shared model cache to avoid loading the sentence transformer model multiple times.
 Reduces startup time from 2s per script to 2s once.
+
+The model is placed on CUDA when available (else Apple MPS, else CPU).
+Setting COGNITIVE_SENSOR_FP16=1 also halves it on CUDA. That is opt-in
+because a half model returns float16 arrays from model.encode(), and
+several callers store embedding.tobytes() that readers decode as float32.
+encode() below always returns float32.
 """
+import os
+
+import numpy as np
 
 _model = None
 _model_name = 'all-MiniLM-L6-v2'
+FP16 = os.environ.get("COGNITIVE_SENSOR_FP16", "0") == "1"
 
 def get_model():
     """
@@ -21,10 +31,31 @@ def get_model():
             print("Install with: pip install -r requirements.txt")
             exit(1)
 
-        _model = SentenceTransformer(_model_name)
+        import torch
+        if torch.cuda.is_available():
+            device = "cuda"
+        elif torch.backends.mps.is_available():
+            device = "mps"
+        else:
+            device = "cpu"
+        _model = SentenceTransformer(_model_name, device=device)
+        if device == "cuda" and FP16:
+            _model.half()
 
     return _model
 
+def encode(texts, **kwargs):
+    """
+    Encode with the cached model into L2-normalized float32 numpy vectors,
+    so cosine similarity is a plain dot product.
+    Keyword arguments override the defaults (batch_size=256, no progress bar).
+    """
+    opts = dict(batch_size=256, convert_to_numpy=True, normalize_embeddings=True,
+                show_progress_bar=False)
+    opts.update(kwargs)
+    # fp16 models return fp16 arrays; callers and BLOB readers expect float32
+    return np.asarray(get_model().encode(texts, **opts), dtype=np.float32)
+
 def get_model_name():
     """Return the model name being used."""
     return _model_name
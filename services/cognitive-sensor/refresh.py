@@ -1,13 +1,16 @@
 """
 Master refresh script for the Cognitive Operating System.
-Runs the full analysis pipeline in sequence with retry logic.
+Runs the full analysis pipeline with retry logic. Stages run as soon as
+the stages they depend on have finished, so independent ones overlap.
 
 Can be run from any directory - uses script location as base.
 Uses a file-based process lock to prevent concurrent pipeline runs.
 """
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 import subprocess
 import sys
+import threading
 import time
 import os
 import atexit
@@ -20,7 +23,39 @@ RETRY_DELAY_S = 3
 # If lock is older than 2x expected max runtime (30 min), consider it stale
 STALE_LOCK_S = 1800
 
+# Stage -> stages that must finish first: the producers of the files it
+# reads, or the previous results.db writer so writes don't contend.
+# A failed or skipped stage still releases its dependents, as the old
+# sequential run carried on past failures.
+STAGES: dict[str, list[str]] = {
+    "behavioral_memory_assess.py": [],
+    "governance_config_api.py": [],
+    "loops.py": [],
+    # No-op unless a contract schema changed since the last build
+    "build_validators.py": [],
+    "completion_stats.py": ["behavioral_memory_assess.py"],
+    "export_cognitive_state.py": ["loops.py", "build_validators.py"],
+    "run_graph_ingest.py": ["export_cognitive_state.py"],
+    "route_today.py": ["export_cognitive_state.py"],
+    "run_predictions.py": ["run_graph_ingest.py"],
+    "export_daily_payload.py": ["export_cognitive_state.py", "run_predictions.py"],
+    "wire_cycleboard.py": ["route_today.py", "export_daily_payload.py"],
+    "behavioral_memory_snapshot.py": ["route_today.py", "completion_stats.py"],
+    "drift_detector.py": ["behavioral_memory_snapshot.py", "governance_config_api.py"],
+    "reporter.py": [],
+    "build_dashboard.py": ["loops.py", "completion_stats.py", "reporter.py"],
+    "build_strategic_priorities.py": ["export_cognitive_state.py"],
+    "genesis_tree.py": [],
+    "ghost_executor.py": ["genesis_tree.py"],
+    # Embeds every .md in the repo, including the ones these stages write
+    "build_docs_manifest.py": ["reporter.py", "genesis_tree.py", "ghost_executor.py"],
+}
+# Stages are subprocesses, so threads are enough to overlap them; several
+# mostly wait on sockets (Neo4j/Ollama probes) or disk, so don't cap at cores
+MAX_WORKERS = max(4, os.cpu_count() or 1)
+
 results: list[tuple[str, str]] = []
+_output_lock = threading.Lock()
 
 
 def acquire_lock() -> None:
@@ -60,6 +95,14 @@ def release_lock() -> None:
         pass
 
 
+def emit(output: bytes) -> None:
+    """Write a finished stage's captured output in one piece."""
+    with _output_lock:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(output)
+        sys.stdout.buffer.flush()
+
+
 def run(script: str) -> None:
     """Run a script with retry logic. Skips missing scripts, retries on failure."""
     script_path = BASE / script
@@ -70,10 +113,14 @@ def run(script: str) -> None:
 
     for attempt in range(MAX_RETRIES + 1):
         try:
-            subprocess.check_call([sys.executable, script], cwd=BASE)
+            # Captured so concurrent stages don't interleave their output
+            proc = subprocess.run([sys.executable, script], cwd=BASE,
+                                  stdout=subprocess.PIPE, stderr=subprocess.STDOUT, check=True)
+            emit(proc.stdout)
             results.append((script, "ok"))
             return
         except subprocess.CalledProcessError as e:
+            emit(e.output)
             if attempt < MAX_RETRIES:
                 print(f"  [RETRY] {script} failed (attempt {attempt + 1}/{MAX_RETRIES + 1}), retrying in {RETRY_DELAY_S}s...")
                 time.sleep(RETRY_DELAY_S)
@@ -82,34 +129,41 @@ def run(script: str) -> None:
                 results.append((script, "failed"))
 
 
-# === PROCESS LOCK ===
-acquire_lock()
-
-run("behavioral_memory_assess.py")
-run("governance_config_api.py")
-run("loops.py")
-run("completion_stats.py")
-run("export_cognitive_state.py")
-run("run_graph_ingest.py")
-run("route_today.py")
-run("run_predictions.py")
-run("export_daily_payload.py")
-run("wire_cycleboard.py")
-run("behavioral_memory_snapshot.py")
-run("drift_detector.py")
-run("reporter.py")
-run("build_dashboard.py")
-run("build_strategic_priorities.py")
-run("genesis_tree.py")
-run("ghost_executor.py")
-run("build_docs_manifest.py")
-
-# Summary
-failed = [s for s, status in results if status == "failed"]
-skipped = [s for s, status in results if status == "skipped"]
-ok_count = sum(1 for _, status in results if status == "ok")
-
-if failed:
-    print(f"\nRefreshed with errors: {ok_count} ok, {len(failed)} failed ({', '.join(failed)}), {len(skipped)} skipped")
-else:
-    print(f"\nRefreshed. {ok_count} scripts completed, {len(skipped)} skipped.")
+def run_stages(stages: dict[str, list[str]]) -> None:
+    """Run every stage once, each as soon as all of its dependencies are done."""
+    pending = dict(stages)
+    running = {}
+    done: set[str] = set()
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        while pending or running:
+            for script, deps in list(pending.items()):
+                if all(d in done for d in deps):
+                    del pending[script]
+                    running[pool.submit(run, script)] = script
+            if not running:
+                raise ValueError(f"Unsatisfiable stage dependencies: {sorted(pending)}")
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for fut in finished:
+                fut.result()
+                done.add(running.pop(fut))
+
+
+def main() -> None:
+    # === PROCESS LOCK ===
+    acquire_lock()
+
+    run_stages(STAGES)
+
+    # Summary
+    failed = [s for s, status in results if status == "failed"]
+    skipped = [s for s, status in results if status == "skipped"]
+    ok_count = sum(1 for _, status in results if status == "ok")
+
+    if failed:
+        print(f"\nRefreshed with errors: {ok_count} ok, {len(failed)} failed ({', '.join(failed)}), {len(skipped)} skipped")
+    else:
+        print(f"\nRefreshed. {ok_count} scripts completed, {len(skipped)} skipped.")
+
+
+if __name__ == "__main__":
+    main()
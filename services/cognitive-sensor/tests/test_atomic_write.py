@@ -0,0 +1,39 @@
+"""Tests for atomic_copy in atomic_write.py."""
+
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from atomic_write import atomic_copy
+
+
+class TestAtomicCopy:
+    """atomic_copy copies content and mtime, and skips an unchanged destination."""
+
+    def test_copies_content_and_mtime(self, tmp_path):
+        src = tmp_path / "src.json"
+        src.write_bytes(b'{"a": 1}')
+        dst = tmp_path / "out" / "dst.json"
+        assert atomic_copy(src, dst) is True
+        assert dst.read_bytes() == b'{"a": 1}'
+        assert dst.stat().st_mtime_ns == src.stat().st_mtime_ns
+        assert not list(dst.parent.glob("*.tmp"))
+
+    def test_skips_when_unchanged(self, tmp_path):
+        src = tmp_path / "src.json"
+        src.write_bytes(b'{"a": 1}')
+        dst = tmp_path / "dst.json"
+        atomic_copy(src, dst)
+        assert atomic_copy(src, dst) is False
+
+    def test_recopies_after_source_changes(self, tmp_path):
+        src = tmp_path / "src.json"
+        src.write_bytes(b'{"a": 1}')
+        dst = tmp_path / "dst.json"
+        atomic_copy(src, dst)
+        src.write_bytes(b'{"a": 2}')
+        os.utime(src, ns=(1, dst.stat().st_mtime_ns + 1_000_000_000))
+        assert atomic_copy(src, dst) is True
+        assert dst.read_bytes() == b'{"a": 2}'
@@ -0,0 +1,119 @@
+"""Tests for embeddings BLOB encoding and the exported matrix in embedding_store.py.
+
+New rows are int8 with a float32 scale prefix; older results.db files hold
+float16 or float32 rows, and decode() tells them apart by BLOB length.
+matrix_for() serves readers from embeddings.npy and returns None whenever
+the export can't answer exactly, so they fall back to the BLOBs.
+"""
+
+import sqlite3
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from embedding_store import EMBEDDING_DIM, decode, encode, export_matrix, matrix_for
+
+
+def unit(rng, n=EMBEDDING_DIM):
+    v = rng.standard_normal(n).astype(np.float32)
+    return v / np.linalg.norm(v)
+
+
+class TestEncodeDecode:
+    """Round trips for the three stored layouts."""
+
+    def test_int8_blob_length(self, rng):
+        assert len(encode(unit(rng))) == EMBEDDING_DIM + 4  # 388
+
+    def test_int8_round_trip(self, rng):
+        v = unit(rng)
+        out = decode(encode(v))
+        assert out.dtype == np.float32
+        assert out.shape == (EMBEDDING_DIM,)
+        # Quantization error is at most half a step of absmax / 127
+        assert np.abs(out - v).max() <= np.abs(v).max() / 127 / 2 + 1e-7
+        assert float(out @ v) / np.linalg.norm(out) > 0.999
+
+    def test_int8_zero_vector(self):
+        out = decode(encode(np.zeros(EMBEDDING_DIM, dtype=np.float32)))
+        assert not out.any()
+
+    def test_legacy_fp16_rows(self, rng):
+        v = unit(rng)
+        blob = v.astype(np.float16).tobytes()
+        assert len(blob) == 768
+        out = decode(blob)
+        assert out.dtype == np.float32
+        np.testing.assert_allclose(out, v, atol=1e-3)
+
+    def test_legacy_fp32_rows(self, rng):
+        v = unit(rng)
+        blob = v.tobytes()
+        assert len(blob) == 1536
+        out = decode(blob)
+        assert out.dtype == np.float32
+        np.testing.assert_array_equal(out, v)
+
+
+class TestMatrixFor:
+    """Lookups against a matrix written by export_matrix()."""
+
+    CIDS = ["c0", "c1", "c2", "c3"]
+
+    def fill(self, con, rng, created_at="2026-01-01T00:00:00"):
+        """(Re)build the embeddings table; returns the decoded vectors in rowid order."""
+        con.execute("DROP TABLE IF EXISTS embeddings")
+        con.execute("CREATE TABLE embeddings (convo_id TEXT, embedding BLOB, created_at TEXT)")
+        vecs = [unit(rng) for _ in self.CIDS]
+        con.executemany("INSERT INTO embeddings VALUES (?, ?, ?)",
+                        [(cid, encode(v), created_at) for cid, v in zip(self.CIDS, vecs)])
+        return np.stack([decode(encode(v)) for v in vecs])
+
+    @pytest.fixture
+    def con(self):
+        con = sqlite3.connect(":memory:")
+        yield con
+        con.close()
+
+    def export(self, con, tmp_path, rng):
+        expected = self.fill(con, rng)
+        path = tmp_path / "embeddings.npy"
+        assert export_matrix(con, path) == len(self.CIDS)
+        return path, expected
+
+    def test_exported_order_is_memmap(self, con, tmp_path, rng):
+        path, expected = self.export(con, tmp_path, rng)
+        E = matrix_for(con, self.CIDS, path)
+        assert isinstance(E, np.memmap)
+        np.testing.assert_array_equal(E, expected)
+
+    def test_reordered_ids(self, con, tmp_path, rng):
+        path, expected = self.export(con, tmp_path, rng)
+        order = [3, 1, 0, 2]
+        E = matrix_for(con, [self.CIDS[i] for i in order], path)
+        np.testing.assert_array_equal(E, expected[order])
+
+    def test_subset_of_ids(self, con, tmp_path, rng):
+        path, expected = self.export(con, tmp_path, rng)
+        E = matrix_for(con, ["c2", "c0"], path)
+        np.testing.assert_array_equal(E, expected[[2, 0]])
+
+    def test_missing_id_returns_none(self, con, tmp_path, rng):
+        path, _ = self.export(con, tmp_path, rng)
+        assert matrix_for(con, ["c0", "nope"], path) is None
+
+    def test_missing_export_returns_none(self, con, rng, tmp_path):
+        self.fill(con, rng)
+        assert matrix_for(con, self.CIDS, tmp_path / "embeddings.npy") is None
+
+    def test_rebuilt_table_returns_none(self, con, tmp_path, rng):
+        """Same ids, new rows, no re-export: the stale matrix must not be served."""
+        path, _ = self.export(con, tmp_path, rng)
+        self.fill(con, rng, created_at="2026-02-01T00:00:00")
+        assert matrix_for(con, self.CIDS, path) is None
+        assert export_matrix(con, path) == len(self.CIDS)
+        assert matrix_for(con, self.CIDS, path) is not None
@@ -0,0 +1,53 @@
+"""Tests for the memory_db.json pickle sidecar in memory_loader.py."""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from memory_loader import _sidecar_fresh, iter_memory, load_memory
+
+
+def write_db(path: Path, convos: list) -> None:
+    path.write_text(json.dumps(convos), encoding="utf-8")
+
+
+class TestSidecar:
+    """The sidecar is only used while it matches the JSON it was built from."""
+
+    def test_first_load_writes_sidecar(self, tmp_path):
+        db = tmp_path / "memory_db.json"
+        write_db(db, [{"title": "a"}])
+        assert load_memory(db) == [{"title": "a"}]
+        assert _sidecar_fresh(db, db.with_suffix(".pkl"))
+
+    def test_sidecar_served_when_unchanged(self, tmp_path):
+        db = tmp_path / "memory_db.json"
+        write_db(db, [{"title": "a"}])
+        load_memory(db)
+        assert load_memory(db) == [{"title": "a"}]
+        assert list(iter_memory(db)) == [{"title": "a"}]
+
+    def test_older_replacement_invalidates(self, tmp_path):
+        """A JSON moved in with an older mtime (mv, cp -p, rsync) must not be shadowed."""
+        db = tmp_path / "memory_db.json"
+        write_db(db, [{"title": "a"}])
+        load_memory(db)
+
+        replacement = tmp_path / "incoming.json"
+        write_db(replacement, [{"title": "b"}])
+        os.utime(replacement, ns=(1, 1))
+        os.replace(replacement, db)
+
+        assert not _sidecar_fresh(db, db.with_suffix(".pkl"))
+        assert load_memory(db) == [{"title": "b"}]
+        assert list(iter_memory(db)) == [{"title": "b"}]
+
+    def test_corrupt_sidecar_falls_back(self, tmp_path):
+        db = tmp_path / "memory_db.json"
+        write_db(db, [{"title": "a"}])
+        db.with_suffix(".pkl").write_bytes(b"")
+        assert load_memory(db) == [{"title": "a"}]
+        assert _sidecar_fresh(db, db.with_suffix(".pkl"))
@@ -0,0 +1,77 @@
+"""Tests for refresh.py stage scheduling.
+
+run_stages() is exercised with run() replaced by a recorder, so no
+pipeline scripts are executed; run() itself is tested against tiny
+scripts in a temp directory.
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import refresh
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    """Replace refresh.run with a thread-safe recorder; returns the call order."""
+    order = []
+    lock = threading.Lock()
+
+    def fake_run(script):
+        with lock:
+            order.append(script)
+
+    monkeypatch.setattr(refresh, "run", fake_run)
+    return order
+
+
+@pytest.fixture
+def results(monkeypatch):
+    fresh = []
+    monkeypatch.setattr(refresh, "results", fresh)
+    return fresh
+
+
+class TestRunStages:
+    """Every stage runs once, after all of its dependencies."""
+
+    def test_dependencies_run_first(self, calls):
+        refresh.run_stages(refresh.STAGES)
+        assert sorted(calls) == sorted(refresh.STAGES)
+        for script, deps in refresh.STAGES.items():
+            for dep in deps:
+                assert calls.index(dep) < calls.index(script)
+
+    def test_chain(self, calls):
+        refresh.run_stages({"c.py": ["b.py"], "b.py": ["a.py"], "a.py": []})
+        assert calls == ["a.py", "b.py", "c.py"]
+
+    def test_unsatisfiable_dependencies(self, calls):
+        with pytest.raises(ValueError, match="b.py"):
+            refresh.run_stages({"a.py": [], "b.py": ["missing.py"]})
+        assert calls == ["a.py"]
+
+
+class TestRun:
+    """run() records ok/failed/skipped, and failures still release dependents."""
+
+    def script(self, tmp_path, name, body):
+        (tmp_path / name).write_text(body, encoding="utf-8")
+
+    def test_missing_stage_skipped(self, tmp_path, monkeypatch, results):
+        monkeypatch.setattr(refresh, "BASE", tmp_path)
+        refresh.run("nope.py")
+        assert results == [("nope.py", "skipped")]
+
+    def test_failed_stage_releases_dependents(self, tmp_path, monkeypatch, results):
+        monkeypatch.setattr(refresh, "BASE", tmp_path)
+        monkeypatch.setattr(refresh, "MAX_RETRIES", 0)
+        self.script(tmp_path, "bad.py", "raise SystemExit(3)\n")
+        self.script(tmp_path, "good.py", "print('ok')\n")
+        refresh.run_stages({"bad.py": [], "good.py": ["bad.py"], "gone.py": ["good.py"]})
+        assert results == [("bad.py", "failed"), ("good.py", "ok"), ("gone.py", "skipped")]
@@ -0,0 +1,163 @@
+"""Tests for load_schema, validate_array_items and validate_payload_bytes in validate.py.
+
+The element-by-element path must give the same verdict, and for a single
+fault the same message, as validating the whole document at once.
+"""
+
+import copy
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import validate
+from validate import (validate_array_items, validate_payload, validate_payload_bytes,
+                      validate_work_ledger, validate_work_ledger_fast)
+
+SCHEMA = "WorkLedger.v1.json"
+ARRAYS = ("active", "queued", "completed")
+
+JOB = {
+    "job_id": "j0",
+    "type": "ai",
+    "title": "Summarize inbox",
+    "outcome": "completed",
+    "started_at": 1,
+    "completed_at": 2,
+    "duration_ms": 1,
+    "error": None,
+    "metrics": {"tokens_used": 10, "cost_usd": 0.01},
+    "metadata": {},
+}
+
+
+@pytest.fixture
+def ledger():
+    return {
+        "active": [],
+        "queued": [],
+        "completed": [dict(JOB, job_id=f"j{i}") for i in range(50)],
+        "stats": {"total_completed": 50, "total_failed": 0, "total_abandoned": 0},
+        "config": {"max_concurrent_jobs": 1, "max_queue_depth": 5},
+    }
+
+
+def assert_parity(doc):
+    expected = validate_payload(doc, SCHEMA)
+    assert validate_array_items(doc, SCHEMA, ARRAYS) == expected
+    assert validate_work_ledger_fast(doc) == validate_work_ledger(doc) == expected
+    return expected
+
+
+class TestLoadSchema:
+    """Compiling a schema must not change what load_schema() hands out."""
+
+    def test_returns_private_copies(self):
+        first, second = validate.load_schema(SCHEMA), validate.load_schema(SCHEMA)
+        assert first == second
+        assert first is not second
+        assert first["properties"]["active"]["items"] is not second["properties"]["active"]["items"]
+
+    def test_compile_leaves_schema_intact(self, ledger, monkeypatch):
+        monkeypatch.setattr(validate, "_COMPILED", {})
+        before = copy.deepcopy(validate.load_schema(SCHEMA))
+        validate_payload(ledger, SCHEMA)
+        assert validate.load_schema(SCHEMA) == before
+
+
+class TestArrayItemsParity:
+    """validate_array_items agrees with validate_payload."""
+
+    def test_valid_ledger(self, ledger):
+        assert assert_parity(ledger) == (True, None)
+
+    @pytest.mark.parametrize("field,value", [
+        ("job_id", 5),
+        ("type", "robot"),
+        ("outcome", None),
+        ("started_at", "yesterday"),
+        ("metrics", [1]),
+    ])
+    def test_bad_item_field(self, ledger, field, value):
+        ledger["completed"][37][field] = value
+        valid, err = assert_parity(ledger)
+        assert not valid
+        assert "completed[37]" in err
+
+    def test_missing_item_field(self, ledger):
+        del ledger["completed"][12]["title"]
+        valid, _ = assert_parity(ledger)
+        assert not valid
+
+    def test_bad_envelope(self, ledger):
+        del ledger["stats"]["total_failed"]
+        valid, _ = assert_parity(ledger)
+        assert not valid
+
+    def test_array_not_a_list(self, ledger):
+        ledger["completed"] = 5
+        valid, _ = assert_parity(ledger)
+        assert not valid
+
+    @pytest.mark.parametrize("doc", [{}, [], "ledger"])
+    def test_not_a_ledger(self, doc):
+        valid, _ = assert_parity(doc)
+        assert not valid
+
+    def test_cached_schema_not_mutated(self, ledger, monkeypatch):
+        # Force fresh compiles of the envelope and item validators
+        monkeypatch.setattr(validate, "_COMPILED", {})
+        before = copy.deepcopy(validate.load_schema(SCHEMA))
+        validate_array_items(ledger, SCHEMA, ARRAYS)
+        assert validate.load_schema(SCHEMA) == before
+
+
+class TestPersistedResults:
+    """validate_payload_bytes(cache_path=...) reuses verdicts across processes."""
+
+    @pytest.fixture
+    def fresh_process(self, monkeypatch):
+        """Forget the in-process caches, as a new run would start without them."""
+        def reset():
+            monkeypatch.setattr(validate, "_RESULT_CACHE", {})
+            monkeypatch.setattr(validate, "_PERSISTED", {})
+        reset()
+        return reset
+
+    @pytest.fixture
+    def counted(self, monkeypatch):
+        calls = []
+        real = validate.validate_payload
+
+        def counting(data, schema_name):
+            calls.append(schema_name)
+            return real(data, schema_name)
+
+        monkeypatch.setattr(validate, "validate_payload", counting)
+        return calls
+
+    def test_unchanged_document_skips_validation(self, tmp_path, ledger, fresh_process, counted):
+        cache = tmp_path / ".validation_cache.json"
+        raw = json.dumps(ledger).encode()
+        assert validate_payload_bytes(raw, SCHEMA, cache) == (True, None)
+        fresh_process()
+        assert validate_payload_bytes(raw, SCHEMA, cache) == (True, None)
+        assert counted == [SCHEMA]
+
+    def test_changed_document_revalidated(self, tmp_path, ledger, fresh_process, counted):
+        cache = tmp_path / ".validation_cache.json"
+        validate_payload_bytes(json.dumps(ledger).encode(), SCHEMA, cache)
+        fresh_process()
+        ledger["completed"][3]["type"] = "robot"
+        raw = json.dumps(ledger).encode()
+        assert validate_payload_bytes(raw, SCHEMA, cache) == validate_payload(ledger, SCHEMA)
+        assert counted == [SCHEMA, SCHEMA]
+
+    def test_corrupt_cache_ignored(self, tmp_path, ledger, fresh_process, counted):
+        cache = tmp_path / ".validation_cache.json"
+        cache.write_text("[not json", encoding="utf-8")
+        assert validate_payload_bytes(json.dumps(ledger).encode(), SCHEMA, cache) == (True, None)
+        assert counted == [SCHEMA]
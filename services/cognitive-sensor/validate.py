@@ -1,29 +1,84 @@
 """
 Contract validation for cognitive-sensor outputs.
 Uses JSON Schema to enforce data contracts before writing payloads.
+
+When fastjsonschema is installed each schema is compiled once into a
+generated Python validator and reused; otherwise a jsonschema validator
+instance is built (and the schema checked) once per schema and reused.
+Validators pre-generated by build_validators.py skip even that compile,
+as long as the schema files haven't changed since they were built.
 """
-import json
+import copy
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
+
+from atomic_write import atomic_write_json
+from io_fast import load_json, loads
 
 try:
     import jsonschema
-    from jsonschema import validate, ValidationError
+    from jsonschema import Draft7Validator, SchemaError
     HAS_JSONSCHEMA = True
 except ImportError:
     HAS_JSONSCHEMA = False
-    ValidationError = Exception
+    Draft7Validator = SchemaError = None
+
+try:
+    import fastjsonschema
+    HAS_FASTJSONSCHEMA = True
+except ImportError:
+    HAS_FASTJSONSCHEMA = False
 
 BASE = Path(__file__).parent.resolve()
 CONTRACTS = BASE.parent.parent / "contracts" / "schemas"
 
+# Match jsonschema's behaviour: don't write defaults into the payload, and
+# treat "format" as an annotation rather than an assertion.
+# Shared with build_validators.py.
+COMPILE_OPTIONS = {"use_default": False, "use_formats": False}
+
+# Every contract declares draft-07, so skip validator_for()'s $schema dispatch
+SCHEMA_DRAFT = Draft7Validator
+
+# One directory listing at import instead of an exists() stat per lookup
+_SCHEMA_PATHS = {p.name: p for p in CONTRACTS.glob("*.json")} if CONTRACTS.is_dir() else {}
+
+_COMPILED: dict[str, Callable[[Any], Any]] = {}
+_VALIDATORS: dict[str, Any] = {}
+# (schema_name, blake2b of the raw bytes) -> validate_payload() result
+_RESULT_CACHE: dict[tuple[str, bytes], tuple[bool, str | None]] = {}
+# cache_path -> its contents, read once per process (see validate_payload_bytes)
+_PERSISTED: dict[Path, dict] = {}
+
+
+@lru_cache(maxsize=32)
+def _parsed_schema(name: str) -> dict:
+    path = _SCHEMA_PATHS.get(name)
+    if path is None:
+        raise FileNotFoundError(f"Schema not found: {CONTRACTS / name}")
+    return loads(path.read_bytes())
+
 
 def load_schema(name: str) -> dict:
-    """Load a JSON schema from contracts/schemas/"""
-    path = CONTRACTS / name
-    if not path.exists():
-        raise FileNotFoundError(f"Schema not found: {path}")
-    return json.load(open(path, encoding="utf-8"))
+    """Load a JSON schema from contracts/schemas/ (parsed once per process).
+
+    Each call returns a private deep copy: fastjsonschema rewrites $refs in
+    the schemas it compiles (including ones fetched through handlers=), so
+    the cached parse is never handed out.
+    """
+    return copy.deepcopy(_parsed_schema(name))
+
+
+def schema_digest(names) -> str:
+    """Digest of the named schema files' contents (staleness check for generated validators)."""
+    h = hashlib.blake2b(digest_size=16)
+    for name in names:
+        h.update(name.encode())
+        h.update((CONTRACTS / name).read_bytes())
+    return h.hexdigest()
 
 
 def validate_payload(data: dict, schema_name: str) -> tuple[bool, str | None]:
@@ -31,18 +86,216 @@ def validate_payload(data: dict, schema_name: str) -> tuple[bool, str | None]:
     Validate data against a schema.
     Returns (True, None) on success, (False, error_message) on failure.
     """
+    if HAS_FASTJSONSCHEMA:
+        return _validate_compiled(data, schema_name)
+
     if not HAS_JSONSCHEMA:
         print(f"[WARN] jsonschema not installed. Skipping validation for {schema_name}")
         return True, None
 
     try:
-        schema = load_schema(schema_name)
-        validate(instance=data, schema=schema)
+        validator = _VALIDATORS.get(schema_name)
+        if validator is None:
+            # Schemas are checked by the self-test (python validate.py), not here
+            validator = _VALIDATORS[schema_name] = SCHEMA_DRAFT(load_schema(schema_name))
+        # Stop at the first error (what is_valid() does) rather than collecting
+        # every error for best_match(); payloads are almost always valid, and
+        # one message is all callers report
+        error = next(validator.iter_errors(data), None)
+    except FileNotFoundError as e:
+        return False, str(e)
+    if error is None:
         return True, None
-    except ValidationError as e:
+    # Formatted straight from the error instead of raising and catching it.
+    # jsonschema's message doesn't say where (fastjsonschema's does), so
+    # append the JSON pointer for nested failures.
+    where = "/".join(map(str, error.absolute_path))
+    return False, f"Validation failed for {schema_name}: {error.message}" + (f" at /{where}" if where else "")
+
+
+@lru_cache(maxsize=None)
+def _generated_module():
+    """_generated_validators, imported on first use (it is large), or None if not built."""
+    try:
+        import _generated_validators
+    except ImportError:  # python build_validators.py
+        return None
+    return _generated_validators
+
+
+def _pregenerated(schema_name: str) -> Callable[[Any], Any] | None:
+    """The build_validators.py validator for `schema_name`, if its schemas are unchanged."""
+    generated = _generated_module()
+    if generated is None:
+        return None
+    entry = generated.SOURCES.get(schema_name)
+    if entry is None:
+        return None
+    digest, names = entry
+    try:
+        if schema_digest(names) != digest:
+            return None
+    except OSError:
+        return None
+    return generated.FACTORIES[schema_name]()
+
+
+def _validate_compiled(data: dict, schema_name: str) -> tuple[bool, str | None]:
+    """validate_payload() via a fastjsonschema validator compiled once per schema."""
+    fn = _COMPILED.get(schema_name)
+    if fn is None:
+        fn = _pregenerated(schema_name)
+    if fn is None:
+        try:
+            schema = load_schema(schema_name)
+        except FileNotFoundError as e:
+            return False, str(e)
+        # Relative $refs (e.g. "LifeSignals.v1.json") name sibling schemas
+        fn = fastjsonschema.compile(schema, handlers={"": load_schema}, **COMPILE_OPTIONS)
+    _COMPILED[schema_name] = fn
+
+    try:
+        fn(data)
+        return True, None
+    except fastjsonschema.JsonSchemaValueException as e:
         return False, f"Validation failed for {schema_name}: {e.message}"
+
+
+@lru_cache(maxsize=32)
+def _schema_files(name: str) -> tuple[str, ...]:
+    """`name` plus every schema file it $refs, directly or through other files."""
+    files = {name: None}
+    pending = [load_schema(name)]
+    while pending:
+        node = pending.pop()
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if isinstance(ref, str) and not ref.startswith("#"):
+                ref_name = ref.split("#", 1)[0]
+                if ref_name not in files:
+                    files[ref_name] = None
+                    pending.append(load_schema(ref_name))
+            pending.extend(node.values())
+        elif isinstance(node, list):
+            pending.extend(node)
+    return tuple(files)
+
+
+def _validate_raw(raw: bytes, schema_name: str) -> tuple[bool, str | None]:
+    try:
+        return validate_payload(loads(raw), schema_name)
+    except ValueError as e:
+        return False, f"Invalid JSON for {schema_name}: {e}"
+
+
+def _validate_persisted(raw: bytes, digest: bytes, schema_name: str,
+                        cache_path: Path) -> tuple[bool, str | None]:
+    try:
+        stamp = [schema_digest(_schema_files(schema_name)), digest.hex()]
+    except OSError:
+        return _validate_raw(raw, schema_name)  # missing schema: validate_payload reports it
+
+    cache = _PERSISTED.get(cache_path)
+    if cache is None:
+        try:
+            cache = load_json(cache_path)
+        except (OSError, ValueError):
+            cache = None
+        if not isinstance(cache, dict):
+            cache = {}
+        _PERSISTED[cache_path] = cache
+
+    entry = cache.get(schema_name)
+    if isinstance(entry, list) and len(entry) == 4 and entry[:2] == stamp:
+        return entry[2], entry[3]
+
+    result = _validate_raw(raw, schema_name)
+    cache[schema_name] = [*stamp, *result]
+    try:
+        atomic_write_json(cache_path, cache)
+    except OSError:
+        pass  # read-only directory: the result is still correct, just not kept
+    return result
+
+
+def validate_payload_bytes(raw: bytes, schema_name: str,
+                           cache_path: Path | None = None) -> tuple[bool, str | None]:
+    """
+    Validate a serialized JSON document against a schema.
+    Byte-identical input seen before in this process returns the cached result
+    without parsing or validating again.
+
+    With cache_path, the latest result per schema is also kept in that JSON
+    file, stamped with digests of the bytes and of the schema files (including
+    $ref'd ones), so a later process skips a document that hasn't changed.
+    """
+    digest = hashlib.blake2b(raw, digest_size=16).digest()
+    key = (schema_name, digest)
+    result = _RESULT_CACHE.get(key)
+    if result is None:
+        if cache_path is None:
+            result = _validate_raw(raw, schema_name)
+        else:
+            result = _validate_persisted(raw, digest, schema_name, Path(cache_path))
+        _RESULT_CACHE[key] = result
+    return result
+
+
+# Array keywords besides "items" that an emptied array can't stand in for
+_ARRAY_KEYWORDS = {"minItems", "maxItems", "uniqueItems", "contains", "additionalItems"}
+
+
+def _item_validator(schema_name: str, key: str) -> Callable[[Any], Any] | None:
+    """Compiled validator for the items of top-level array `key`, or None if not streamable."""
+    cache_key = f"{schema_name}#/properties/{key}/items"
+    fn = _COMPILED.get(cache_key)
+    if fn is None:
+        schema = load_schema(schema_name)
+        prop = schema.get("properties", {}).get(key, {})
+        items = prop.get("items")
+        if not isinstance(items, dict) or _ARRAY_KEYWORDS & prop.keys():
+            return None
+        # Keep the root's $id/definitions so "#/definitions/..." refs resolve
+        root = {k: schema[k] for k in ("$schema", "$id", "definitions") if k in schema}
+        # The merge is shallow and compile rewrites $refs in place
+        fn = fastjsonschema.compile(copy.deepcopy({**root, **items}),
+                                    handlers={"": load_schema}, **COMPILE_OPTIONS)
+        _COMPILED[cache_key] = fn
+    return fn
+
+
+def validate_array_items(data: dict, schema_name: str, array_keys) -> tuple[bool, str | None]:
+    """
+    validate_payload() for documents dominated by large top-level arrays.
+
+    The envelope is validated with those arrays emptied, then every element
+    against the array's item validator, compiled once. The whole-document
+    validator builds a "data.key[i]" path string per element even when it
+    is valid; this loop doesn't, which roughly halves the time on a large
+    ledger. Failure messages are the same as validate_payload()'s, though
+    with several errors a different one may be reported first. Without
+    fastjsonschema this is just validate_payload().
+    """
+    if not (HAS_FASTJSONSCHEMA and isinstance(data, dict)):
+        return validate_payload(data, schema_name)
+    try:
+        arrays = {k: (data[k], _item_validator(schema_name, k))
+                  for k in array_keys if isinstance(data.get(k), list)}
     except FileNotFoundError as e:
         return False, str(e)
+    arrays = {k: v for k, v in arrays.items() if v[1] is not None}
+
+    valid, err = validate_payload({**data, **dict.fromkeys(arrays, [])}, schema_name)
+    if not valid:
+        return valid, err
+    for key, (items, fn) in arrays.items():
+        for i, item in enumerate(items):
+            try:
+                fn(item)
+            except fastjsonschema.JsonSchemaValueException as e:
+                message = e.message.replace("data", f"data.{key}[{i}]", 1)
+                return False, f"Validation failed for {schema_name}: {message}"
+    return True, None
 
 
 def validate_daily_payload(payload: dict) -> tuple[bool, str | None]:
@@ -70,6 +323,11 @@ def validate_work_ledger(ledger: dict) -> tuple[bool, str | None]:
     return validate_payload(ledger, "WorkLedger.v1.json")
 
 
+def validate_work_ledger_fast(ledger: dict) -> tuple[bool, str | None]:
+    """validate_work_ledger() element by element; for large ledgers."""
+    return validate_array_items(ledger, "WorkLedger.v1.json", ("active", "queued", "completed"))
+
+
 def require_valid(data: dict, schema_name: str, context: str = "") -> None:
     """
     Validate and raise on failure. Use this to hard-block invalid writes.
@@ -79,54 +337,51 @@ def require_valid(data: dict, schema_name: str, context: str = "") -> None:
         raise ValueError(f"[CONTRACT VIOLATION] {context}: {error}")
 
 
+def _check_file(path: Path, check: Callable[[Any], tuple[bool, str | None]]) -> tuple[bool, str | None] | None:
+    """Self-test helper: run `check` on the parsed file, or None if it doesn't exist."""
+    try:
+        data = load_json(path)
+    except FileNotFoundError:
+        return None
+    return check(data)
+
+
 if __name__ == "__main__":
     # Self-test: validate current outputs
     print("Contract Validation Self-Test")
     print("=" * 40)
 
-    # Test DailyPayload
-    daily_path = BASE / "cycleboard" / "brain" / "daily_payload.json"
-    if daily_path.exists():
-        payload = json.load(open(daily_path, encoding="utf-8"))
-        valid, err = validate_daily_payload(payload)
-        print(f"DailyPayload: {'PASS' if valid else 'FAIL'}")
-        if err:
+    if __debug__ and HAS_JSONSCHEMA:
+        # validate_payload() trusts the contracts; make sure they are well-formed
+        bad = []
+        for name in sorted(_SCHEMA_PATHS):
+            try:
+                SCHEMA_DRAFT.check_schema(load_schema(name))
+            except SchemaError as e:
+                bad.append(f"{name}: {e.message}")
+        print(f"Schemas: {'PASS' if not bad else 'FAIL'} ({len(_SCHEMA_PATHS)} checked)")
+        for err in bad:
             print(f"  {err}")
-    else:
-        print("DailyPayload: SKIP (file not found)")
-
-    # Test cognitive_state (note: schema mismatch expected)
-    cog_path = BASE / "cognitive_state.json"
-    if cog_path.exists():
-        state = json.load(open(cog_path, encoding="utf-8"))
-        valid, err = validate_cognitive_metrics(state)
-        print(f"CognitiveMetrics: {'PASS' if valid else 'FAIL'}")
-        if err:
-            print(f"  {err}")
-    else:
-        print("CognitiveMetrics: SKIP (file not found)")
-
-    # Test closures registry (Phase 5B)
-    closures_path = BASE / "closures.json"
-    if closures_path.exists():
-        closures = json.load(open(closures_path, encoding="utf-8"))
-        valid, err = validate_closures(closures)
-        print(f"Closures: {'PASS' if valid else 'FAIL'}")
-        if err:
-            print(f"  {err}")
-    else:
-        print("Closures: SKIP (file not found)")
-
-    # Test work ledger (Phase 6A)
-    work_ledger_path = BASE / "work_ledger.json"
-    if work_ledger_path.exists():
-        ledger = json.load(open(work_ledger_path, encoding="utf-8"))
-        valid, err = validate_work_ledger(ledger)
-        print(f"WorkLedger: {'PASS' if valid else 'FAIL'}")
-        if err:
-            print(f"  {err}")
-    else:
-        print("WorkLedger: SKIP (file not found)")
+
+    # name, file, validator; files are parsed and validated concurrently
+    checks = [
+        ("DailyPayload", BASE / "cycleboard" / "brain" / "daily_payload.json", validate_daily_payload),
+        # note: schema mismatch expected
+        ("CognitiveMetrics", BASE / "cognitive_state.json", validate_cognitive_metrics),
+        ("Closures", BASE / "closures.json", validate_closures),  # Phase 5B
+        ("WorkLedger", BASE / "work_ledger.json", validate_work_ledger_fast),  # Phase 6A
+    ]
+    with ThreadPoolExecutor(max_workers=len(checks)) as ex:
+        futures = [(name, ex.submit(_check_file, path, check)) for name, path, check in checks]
+        for name, future in futures:
+            result = future.result()
+            if result is None:
+                print(f"{name}: SKIP (file not found)")
+                continue
+            valid, err = result
+            print(f"{name}: {'PASS' if valid else 'FAIL'}")
+            if err:
+                print(f"  {err}")
 
     print("=" * 40)
     print("Done.")
@@ -7,11 +7,14 @@ to keep the brain directory lightweight.
 Also derives lifecycle_board.json from harvest manifests + today's closures.
 """
 
-import json
+import os
 import shutil
+import sys
 from datetime import date, datetime, timezone
 from pathlib import Path
-from atomic_write import atomic_write_json, atomic_write_text
+from atomic_write import atomic_copy, atomic_write_json
+from io_fast import load_json
+from validate import validate_payload_bytes
 
 WORKSPACE = Path(__file__).parent.resolve()
 CYCLEBOARD_DIR = WORKSPACE / "cycleboard"
@@ -20,12 +23,14 @@ HARVEST_DIR = WORKSPACE / "harvest"
 IN_PROGRESS_STATUSES = {"PLANNED", "BUILDING", "REVIEWING"}
 TERMINAL_STATUSES = {"DONE", "RESOLVED", "DROPPED"}
 
-print("=" * 50)
-print("COGNITIVE WIRING")
-print("=" * 50)
+# Report lines, written to stdout in one go at the end
+lines = ["=" * 50, "COGNITIVE WIRING", "=" * 50]
 
 BRAIN_DIR.mkdir(parents=True, exist_ok=True)
 
+# One directory listing answers every "is this source here?" check below
+present = {e.name for e in os.scandir(WORKSPACE)}
+
 # Direct copy files: source name -> brain name
 COPY_FILES = {
     "cognitive_state.json": "cognitive_state.json",
@@ -37,21 +42,36 @@ COPY_FILES = {
     "closures.json": "closures.json",
 }
 
+# Contract checked before wiring; a violation is reported but still copied
+COPY_SCHEMAS = {
+    "cognitive_state.json": "CognitiveMetricsComputed.json",
+    "daily_payload.json": "DailyPayload.v1.json",
+    "closures.json": "Closures.v1.json",
+}
+# Last verdict per schema, so an unchanged file isn't re-validated next run
+VALIDATION_CACHE = BRAIN_DIR / ".validation_cache.json"
+
 for src_name, dst_name in COPY_FILES.items():
     src = WORKSPACE / src_name
-    if src.exists():
-        content = src.read_text(encoding="utf-8")
-        atomic_write_text(BRAIN_DIR / dst_name, content)
-        print(f"[OK] {src_name}")
+    if src_name in present:
+        raw = src.read_bytes()
+        schema_name = COPY_SCHEMAS.get(src_name)
+        if schema_name:
+            valid, err = validate_payload_bytes(raw, schema_name, VALIDATION_CACHE)
+            if not valid:
+                lines.append(f"[WARN] {src_name}: {err}")
+        if atomic_copy(src, BRAIN_DIR / dst_name):
+            lines.append(f"[OK] {src_name}")
+        else:
+            lines.append(f"[OK] {src_name} (unchanged)")
     else:
-        print(f"[WARN] {src_name} not found")
+        lines.append(f"[WARN] {src_name} not found")
 
 # Trim idea_registry.json — full file is ~3MB, CycleBoard only needs top ideas
 idea_src = WORKSPACE / "idea_registry.json"
-if idea_src.exists():
+if idea_src.name in present:
     try:
-        with open(idea_src, "r", encoding="utf-8") as f:
-            registry = json.load(f)
+        registry = load_json(idea_src)
 
         tiers = registry.get("tiers", {})
         metadata = registry.get("metadata", {})
@@ -77,11 +97,11 @@ if idea_src.exists():
 
         out = BRAIN_DIR / "idea_registry.json"
         atomic_write_json(out, trimmed, ensure_ascii=False)
-        print(f"[OK] idea_registry.json (trimmed: {len(execute_now)} execute_now, {len(next_up)} next_up)")
+        lines.append(f"[OK] idea_registry.json (trimmed: {len(execute_now)} execute_now, {len(next_up)} next_up)")
     except Exception as e:
-        print(f"[WARN] idea_registry.json trim failed: {e}")
+        lines.append(f"[WARN] idea_registry.json trim failed: {e}")
 else:
-    print("[WARN] idea_registry.json not found")
+    lines.append("[WARN] idea_registry.json not found")
 
 
 def _build_lifecycle_board() -> dict:
@@ -89,14 +109,12 @@ def _build_lifecycle_board() -> dict:
     in_progress: list[dict] = []
     counts = {s: 0 for s in ("HARVESTED", "PLANNED", "BUILDING", "REVIEWING", "DONE", "RESOLVED", "DROPPED")}
 
-    if HARVEST_DIR.exists():
+    if HARVEST_DIR.name in present:
         for entry in sorted(HARVEST_DIR.iterdir()):
             manifest = entry / "manifest.json"
-            if not manifest.exists():
-                continue
             try:
-                m = json.loads(manifest.read_text(encoding="utf-8"))
-            except Exception:
+                m = load_json(manifest)
+            except Exception:  # no manifest yet, or unreadable
                 continue
             status = m.get("status", "HARVESTED")
             if status in counts:
@@ -115,9 +133,9 @@ def _build_lifecycle_board() -> dict:
     terminal_today: dict[str, list[dict]] = {"DONE": [], "RESOLVED": [], "DROPPED": []}
     closures_path = WORKSPACE / "closures.json"
     today_iso = date.today().isoformat()
-    if closures_path.exists():
+    if closures_path.name in present:
         try:
-            raw = json.loads(closures_path.read_text(encoding="utf-8"))
+            raw = load_json(closures_path)
             closures = raw.get("closures", raw) if isinstance(raw, dict) else raw
             if isinstance(closures, list):
                 for c in closures:
@@ -147,9 +165,10 @@ def _build_lifecycle_board() -> dict:
 
 lifecycle = _build_lifecycle_board()
 atomic_write_json(BRAIN_DIR / "lifecycle_board.json", lifecycle, ensure_ascii=False)
-print(f"[OK] lifecycle_board.json "
-      f"({len(lifecycle['in_progress'])} in-progress, "
-      f"{sum(len(v) for v in lifecycle['terminal_today'].values())} terminal today)")
+lines.append(f"[OK] lifecycle_board.json "
+             f"({len(lifecycle['in_progress'])} in-progress, "
+             f"{sum(len(v) for v in lifecycle['terminal_today'].values())} terminal today)")
 
-print()
-print("Brain files wired to:", BRAIN_DIR)
+lines.append("")
+lines.append(f"Brain files wired to: {BRAIN_DIR}")
+sys.stdout.write("\n".join(lines) + "\n")